@@ -6,15 +6,51 @@ Supports baseline establishment and comparison across improvement cycles.
 
 from __future__ import annotations
 
-import json
 import time
+from collections.abc import Set
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+# Saved files are key-sorted, so equal payloads are byte-identical on disk
+try:  # orjson is an optional speedup for reading and writing benchmark files
+    import orjson
 
-@dataclass
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+# Metrics where a lower value is an improvement (compare_to_baseline default)
+_LOWER_IS_BETTER = frozenset(
+    {
+        "tokens_per_task",
+        "execution_time_s",
+        "error_rate",
+        "bug_escape_rate",
+        "rework_rate",
+    }
+)
+
+# load_all_cycles reads files on a thread pool from this many cycles up
+_PARALLEL_LOAD_MIN = 4
+_PARALLEL_LOAD_WORKERS = 8
+
+# |improvement_pct| at or below this counts as unchanged
+_CHANGE_THRESHOLD_PCT = 1.0
+
+
+@dataclass(slots=True)
 class BenchmarkSample:
     """A single measurement of a metric."""
 
@@ -39,6 +75,14 @@ class CycleBenchmark:
     samples: list[BenchmarkSample] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Latest sample per metric. A plain attribute rather than a field, so
+        # asdict() (and hence the saved file) leaves it out. Kept current by
+        # add_sample — don't append to ``samples`` directly.
+        self._latest: dict[str, BenchmarkSample] = {
+            sample.metric: sample for sample in self.samples
+        }
+
     def add_sample(
         self,
         metric: str,
@@ -47,26 +91,23 @@ class CycleBenchmark:
         **metadata: Any,
     ) -> None:
         """Record a single metric measurement."""
-        self.samples.append(
-            BenchmarkSample(metric=metric, value=value, unit=unit, metadata=metadata)
+        sample = BenchmarkSample(
+            metric=metric, value=value, unit=unit, metadata=metadata
         )
+        self.samples.append(sample)
+        self._latest[metric] = sample
 
     def get_metric(self, metric: str) -> float | None:
         """Get the latest value for a named metric."""
-        for sample in reversed(self.samples):
-            if sample.metric == metric:
-                return sample.value
-        return None
+        sample = self._latest.get(metric)
+        return sample.value if sample is not None else None
 
     def get_all_metrics(self) -> dict[str, float]:
         """Get latest values for all metrics."""
-        result: dict[str, float] = {}
-        for sample in self.samples:
-            result[sample.metric] = sample.value
-        return result
+        return {metric: sample.value for metric, sample in self._latest.items()}
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkBaseline:
     """Baseline measurements for comparison."""
 
@@ -82,7 +123,7 @@ class BenchmarkBaseline:
         self.units[name] = unit
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkComparison:
     """Comparison between a cycle's metrics and the baseline."""
 
@@ -95,13 +136,24 @@ class BenchmarkComparison:
 
     @property
     def change_direction(self) -> str:
-        if self.improvement_pct > 1.0:
+        if self.improvement_pct > _CHANGE_THRESHOLD_PCT:
             return "improved"
-        if self.improvement_pct < -1.0:
+        if self.improvement_pct < -_CHANGE_THRESHOLD_PCT:
             return "regressed"
         return "unchanged"
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a sibling temp file and rename.
+
+    Readers (and a crash mid-write) see either the old file or the new one,
+    never a truncated one.
+    """
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
 class BenchmarkStore:
     """Persistent storage for benchmark data.
 
@@ -116,9 +168,7 @@ class BenchmarkStore:
     def save_baseline(self, baseline: BenchmarkBaseline) -> Path:
         """Save a baseline to disk."""
         path = self.bench_dir / "baseline.json"
-        path.write_text(
-            json.dumps(asdict(baseline), indent=2), encoding="utf-8"
-        )
+        _write_atomic(path, _json_dumps(asdict(baseline)))
         return path
 
     def load_baseline(self) -> BenchmarkBaseline | None:
@@ -127,17 +177,15 @@ class BenchmarkStore:
         if not path.exists():
             return None
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = _json_loads(path.read_bytes())
             return BenchmarkBaseline(**data)
-        except (json.JSONDecodeError, TypeError, KeyError):
+        except (ValueError, TypeError, KeyError):
             return None
 
     def save_cycle(self, benchmark: CycleBenchmark) -> Path:
         """Save a cycle benchmark to disk."""
         path = self.bench_dir / f"cycle_{benchmark.cycle_id}.json"
-        path.write_text(
-            json.dumps(asdict(benchmark), indent=2), encoding="utf-8"
-        )
+        _write_atomic(path, _json_dumps(asdict(benchmark)))
         return path
 
     def load_cycle(self, cycle_id: str) -> CycleBenchmark | None:
@@ -146,10 +194,10 @@ class BenchmarkStore:
         if not path.exists():
             return None
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = _json_loads(path.read_bytes())
             samples = [BenchmarkSample(**s) for s in data.pop("samples", [])]
             return CycleBenchmark(**data, samples=samples)
-        except (json.JSONDecodeError, TypeError, KeyError):
+        except (ValueError, TypeError, KeyError):
             return None
 
     def list_cycles(self) -> list[str]:
@@ -162,18 +210,22 @@ class BenchmarkStore:
 
     def load_all_cycles(self) -> list[CycleBenchmark]:
         """Load all cycle benchmarks, sorted by ID."""
-        return [
-            cb
-            for cid in self.list_cycles()
-            if (cb := self.load_cycle(cid)) is not None
-        ]
+        ids = self.list_cycles()
+        if len(ids) < _PARALLEL_LOAD_MIN:
+            cycles = [self.load_cycle(cid) for cid in ids]
+        else:
+            # File reads release the GIL; map() keeps the sorted order
+            workers = min(_PARALLEL_LOAD_WORKERS, len(ids))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                cycles = list(pool.map(self.load_cycle, ids))
+        return [cb for cb in cycles if cb is not None]
 
 
 def compare_to_baseline(
     baseline: BenchmarkBaseline,
     cycle: CycleBenchmark,
     *,
-    lower_is_better: set[str] | None = None,
+    lower_is_better: Set[str] | None = None,
 ) -> list[BenchmarkComparison]:
     """Compare cycle metrics to the baseline.
 
@@ -186,39 +238,46 @@ def compare_to_baseline(
     lower_is_better : set[str], optional
         Metrics where lower values are improvements (e.g., "tokens_per_task",
         "execution_time_s"). Default: {"tokens_per_task", "execution_time_s",
-        "error_rate", "bug_escape_rate"}.
+        "error_rate", "bug_escape_rate", "rework_rate"}.
 
     Returns
     -------
     list[BenchmarkComparison]
-        One entry per shared metric.
+        One entry per shared metric, in the order of whichever side has
+        fewer metrics.
     """
     if lower_is_better is None:
-        lower_is_better = {
-            "tokens_per_task",
-            "execution_time_s",
-            "error_rate",
-            "bug_escape_rate",
-            "rework_rate",
-        }
+        lower_is_better = _LOWER_IS_BETTER
 
     comparisons: list[BenchmarkComparison] = []
     current_metrics = cycle.get_all_metrics()
+    units = baseline.units
+
+    baseline_metrics = baseline.metrics
+
+    # Walk the smaller side and probe the other for the shared metrics
+    if len(current_metrics) < len(baseline_metrics):
+        shared = (
+            (metric, baseline_metrics.get(metric), current_val)
+            for metric, current_val in current_metrics.items()
+        )
+    else:
+        shared = (
+            (metric, baseline_val, current_metrics.get(metric))
+            for metric, baseline_val in baseline_metrics.items()
+        )
 
-    for metric, baseline_val in baseline.metrics.items():
-        if metric not in current_metrics:
+    for metric, baseline_val, current_val in shared:
+        if baseline_val is None or current_val is None:
             continue
-        current_val = current_metrics[metric]
-        unit = baseline.units.get(metric, "")
+        unit = units.get(metric, "")
 
         if baseline_val == 0:
             pct = 0.0
-        elif metric in lower_is_better:
-            # Lower is better: improvement = (baseline - current) / baseline
-            pct = ((baseline_val - current_val) / abs(baseline_val)) * 100
         else:
-            # Higher is better: improvement = (current - baseline) / baseline
-            pct = ((current_val - baseline_val) / abs(baseline_val)) * 100
+            # Signed so a positive pct is always an improvement
+            sign = -1 if metric in lower_is_better else 1
+            pct = sign * (current_val - baseline_val) / abs(baseline_val) * 100
 
         comparisons.append(
             BenchmarkComparison(
@@ -227,7 +286,7 @@ def compare_to_baseline(
                 current_value=current_val,
                 unit=unit,
                 improvement_pct=round(pct, 2),
-                improved=pct > 1.0,
+                improved=pct > _CHANGE_THRESHOLD_PCT,
             )
         )
 
@@ -244,7 +303,12 @@ def format_comparison_table(comparisons: list[BenchmarkComparison]) -> str:
         "|--------|----------|---------|--------|--------|",
     ]
     for c in comparisons:
-        status = "✅" if c.improved else ("⚠️" if c.improvement_pct < -1 else "➖")
+        if c.improved:
+            status = "✅"
+        elif c.change_direction == "regressed":
+            status = "⚠️"
+        else:
+            status = "➖"
         sign = "+" if c.improvement_pct > 0 else ""
         lines.append(
             f"| {c.metric} | {c.baseline_value:.2f} {c.unit} "
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from kodo.sessions.base import QueryResult, RetryStrategy, Session, SessionCheckpoint
@@ -32,6 +33,11 @@ class AgentResult:
     def elapsed_s(self) -> float:
         return self.query.elapsed_s
 
+    @cached_property
+    def formatted_report(self) -> str:
+        """``format_report()``, built once per result."""
+        return self.format_report()
+
     def format_report(self) -> str:
         """Format the result with context metadata for the orchestrator."""
         parts = []
@@ -10,7 +10,7 @@ import json
 import threading
 import time
 from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -39,11 +39,18 @@ class _AgentStats:
 
 @dataclass
 class RunStats:
-    """Accumulates per-agent and per-bucket cost stats during a run."""
+    """Accumulates per-agent and per-bucket cost stats during a run.
+
+    Agents record from worker threads while the stats table is printed from
+    the orchestrator's, so every access to ``agents`` goes through ``_lock``.
+    """
 
     agents: dict[str, _AgentStats] = field(default_factory=dict)
     orchestrator_cost_usd: float = 0.0
     orchestrator_bucket: str = "api"
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
 
     def record_agent(
         self,
@@ -55,38 +62,53 @@ class RunStats:
         is_error: bool,
         cost_bucket: str,
     ) -> None:
-        if agent not in self.agents:
-            self.agents[agent] = _AgentStats(cost_bucket=cost_bucket)
-        s = self.agents[agent]
-        s.calls += 1
-        s.cost_usd += cost_usd
-        s.input_tokens += input_tokens
-        s.output_tokens += output_tokens
-        s.elapsed_s += elapsed_s
-        if is_error:
-            s.errors += 1
-        if cost_bucket:
-            s.cost_bucket = cost_bucket
+        with self._lock:
+            if agent not in self.agents:
+                self.agents[agent] = _AgentStats(cost_bucket=cost_bucket)
+            s = self.agents[agent]
+            s.calls += 1
+            s.cost_usd += cost_usd
+            s.input_tokens += input_tokens
+            s.output_tokens += output_tokens
+            s.elapsed_s += elapsed_s
+            if is_error:
+                s.errors += 1
+            if cost_bucket:
+                s.cost_bucket = cost_bucket
 
     def record_orchestrator(self, cost_usd: float, bucket: str = "api") -> None:
-        self.orchestrator_cost_usd += cost_usd
-        self.orchestrator_bucket = bucket
+        with self._lock:
+            self.orchestrator_cost_usd += cost_usd
+            self.orchestrator_bucket = bucket
+
+    def snapshot(self) -> RunStats:
+        """A consistent copy, safe to read while agents keep recording."""
+        with self._lock:
+            return RunStats(
+                agents={name: replace(s) for name, s in self.agents.items()},
+                orchestrator_cost_usd=self.orchestrator_cost_usd,
+                orchestrator_bucket=self.orchestrator_bucket,
+            )
 
     @property
     def total_exchanges(self) -> int:
-        return sum(s.calls for s in self.agents.values())
+        with self._lock:
+            return sum(s.calls for s in self.agents.values())
 
     def cost_by_bucket(self) -> dict[str, float]:
         buckets: dict[str, float] = defaultdict(float)
-        for s in self.agents.values():
-            buckets[s.cost_bucket] += s.cost_usd
-        buckets[self.orchestrator_bucket] += self.orchestrator_cost_usd
+        with self._lock:
+            for s in self.agents.values():
+                buckets[s.cost_bucket] += s.cost_usd
+            buckets[self.orchestrator_bucket] += self.orchestrator_cost_usd
         return dict(buckets)
 
     def total_cost(self) -> float:
-        return (
-            sum(s.cost_usd for s in self.agents.values()) + self.orchestrator_cost_usd
-        )
+        with self._lock:
+            return (
+                sum(s.cost_usd for s in self.agents.values())
+                + self.orchestrator_cost_usd
+            )
 
 
 _run_stats = RunStats()
@@ -188,28 +210,34 @@ def print_stats_table(final: bool = False) -> None:
     Called periodically during a run and once at termination.
     """
     global _virtual_cost_note_shown
-    stats = _run_stats
+    # One snapshot for the whole table: rows and totals agree, and agents
+    # recording meanwhile can't resize the dict under our loops.
+    stats = _run_stats.snapshot()
     if not stats.agents:
         return
 
     elapsed = time.monotonic() - (_start_time or time.monotonic())
 
+    # Built as one block and written with a single print() so concurrent
+    # agent handlers can't interleave their rows.
+    lines: list[str] = []
+
     # Header
     sep = "-" * 70
     label = "FINAL STATS" if final else "PROGRESS"
-    print(f"\n  {sep}")
-    print(f"  | {label:<66} |")
-    print(
+    lines.append(f"\n  {sep}")
+    lines.append(f"  | {label:<66} |")
+    lines.append(
         f"  | {'Agent':<20} {'Bucket':<10} {'#':>3} {'Cost':>7}"
         f" {'In':>5} {'Out':>5} {'Time':>6} {'Err':>3} |"
     )
-    print(f"  |{sep[1:-1]}|")
+    lines.append(f"  |{sep[1:-1]}|")
 
     for agent, s in sorted(stats.agents.items()):
         has_tokens = s.cost_bucket != "cursor_subscription"
         in_tok = _fmt_tokens(s.input_tokens) if has_tokens else "-"
         out_tok = _fmt_tokens(s.output_tokens) if has_tokens else "-"
-        print(
+        lines.append(
             f"  | {agent:<20} {_bucket_label(s.cost_bucket):<10}"
             f" {s.calls:>3} {_fmt_cost(s.cost_usd):>7}"
             f" {in_tok:>5} {out_tok:>5}"
@@ -218,37 +246,38 @@ def print_stats_table(final: bool = False) -> None:
 
     # Orchestrator row
     if stats.orchestrator_cost_usd > 0:
-        print(
+        lines.append(
             f"  | {'orchestrator':<20} {_bucket_label(stats.orchestrator_bucket):<10}"
             f" {'':>3} {_fmt_cost(stats.orchestrator_cost_usd):>7}"
             f" {'':>5} {'':>5} {'':>6} {'':>3} |"
         )
 
-    print(f"  |{sep[1:-1]}|")
+    lines.append(f"  |{sep[1:-1]}|")
 
     # Totals by bucket
     buckets = stats.cost_by_bucket()
     api = buckets.get("api", 0)
     sub = sum(v for k, v in buckets.items() if k != "api")
     total = stats.total_cost()
-    print(
+    lines.append(
         f"  | {'Total':<20} {'':10} {stats.total_exchanges:>3}"
         f" {_fmt_cost(total):>7} {'':>5} {'':>5}"
         f" {_fmt_time(elapsed):>6} {'':>3} |"
     )
-    print(
+    lines.append(
         f"  |   API: {_fmt_cost(api):<7}"
         f"  Virtual: {_fmt_cost(sub):<7}"
         f"  Wall: {_fmt_time(elapsed):<27}|"
     )
-    print(f"  {sep}")
+    lines.append(f"  {sep}")
     if not _virtual_cost_note_shown and sub > 0:
-        print(
+        lines.append(
             "    Virtual = Claude Code's API cost estimate."
             " Not charged on Max/Pro subscriptions."
         )
         _virtual_cost_note_shown = True
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
 def get_run_id() -> str | None:
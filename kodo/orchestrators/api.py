@@ -90,7 +90,7 @@ def _build_tools(
                     log.tprint(error_msg)
                     return error_msg
 
-                report = agent_result.format_report()[:10000]
+                report = agent_result.formatted_report[:10000]
                 log.emit(
                     "orchestrator_tool_result",
                     agent=agent_name,
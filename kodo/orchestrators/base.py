@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import os
 import re
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Protocol
 
+from kodo import log
 from kodo.agent import Agent
 from kodo.sessions.base import SessionCheckpoint
+from kodo.viewer import open_viewer
 
 
 # Team is just a named dict of agents
@@ -233,7 +240,7 @@ class StageResult:
     summary: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CycleResult:
     """Result of a single orchestration cycle (one 'day of work')."""
 
@@ -245,20 +252,33 @@ class CycleResult:
     stage_index: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Result of a full multi-cycle run."""
 
     cycles: list[CycleResult] = field(default_factory=list)
     stage_results: list[StageResult] = field(default_factory=list)
+    # Running totals, kept in sync by add_cycle() so reads stay O(1)
+    _total_exchanges: int = field(default=0, init=False, repr=False)
+    _total_cost_usd: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._total_exchanges = sum(c.exchanges for c in self.cycles)
+        self._total_cost_usd = sum(c.total_cost_usd for c in self.cycles)
+
+    def add_cycle(self, cycle: CycleResult) -> None:
+        """Append *cycle* and fold it into the running totals."""
+        self.cycles.append(cycle)
+        self._total_exchanges += cycle.exchanges
+        self._total_cost_usd += cycle.total_cost_usd
 
     @property
     def total_exchanges(self) -> int:
-        return sum(c.exchanges for c in self.cycles)
+        return self._total_exchanges
 
     @property
     def total_cost_usd(self) -> float:
-        return sum(c.total_cost_usd for c in self.cycles)
+        return self._total_cost_usd
 
     @property
     def finished(self) -> bool:
@@ -269,7 +289,7 @@ class RunResult:
         return self.cycles[-1].summary if self.cycles else ""
 
 
-ORCHESTRATOR_SYSTEM_PROMPT = """
+ORCHESTRATOR_SYSTEM_PROMPT = """\
 You are an orchestrator managing a team of AI agents working on a software project.
 
 Your strategy: leverage the AI workers to solve low level problems, you ensure 
@@ -325,57 +345,67 @@ For TypeScript/JavaScript codebases:
 - Instead: ask the agent to find ALL instances of that pattern and fix them all
 - Verification: run `npm run build` BEFORE marking work as done
 - If build fails, examine the error, understand the root cause, and ask the agent to re-fix properly
-- Only commit when `npm run build` passes completely
-""".strip()
+- Only commit when `npm run build` passes completely"""
+
+
+_DONE_TOOL: dict = {
+    "name": "done",
+    "description": "Signal that the goal is complete (or cannot be completed). "
+    "This triggers automated verification by the tester and architect. "
+    "If they find issues, the call is rejected and you must fix them first.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "summary": {
+                "type": "string",
+                "description": "Summary of what was accomplished.",
+            },
+            "success": {
+                "type": "boolean",
+                "description": "Whether the goal was achieved.",
+            },
+        },
+        "required": ["summary", "success"],
+    },
+}
 
 
-def build_team_tools(team: TeamConfig) -> list[dict]:
-    """Build Anthropic-style tool definitions from a team config."""
-    tools = []
-    for name, agent in team.items():
-        tools.append(
-            {
-                "name": f"ask_{name}",
-                "description": f"Delegate a task to the {name} agent.\n{agent.description.strip()}",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "task": {
-                            "type": "string",
-                            "description": f"The directive/task to give to {name}.",
-                        },
-                        "new_conversation": {
-                            "type": "boolean",
-                            "description": "Reset agent's session (rarely needed). Default: false.",
-                        },
-                    },
-                    "required": ["task"],
-                },
-            }
-        )
+@lru_cache(maxsize=256)
+def _agent_tool(name: str, description: str) -> dict:
+    """Build (once) the ``ask_<name>`` tool definition for an agent.
 
-    tools.append(
-        {
-            "name": "done",
-            "description": "Signal that the goal is complete (or cannot be completed). "
-            "This triggers automated verification by the tester and architect. "
-            "If they find issues, the call is rejected and you must fix them first.",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "summary": {
-                        "type": "string",
-                        "description": "Summary of what was accomplished.",
-                    },
-                    "success": {
-                        "type": "boolean",
-                        "description": "Whether the goal was achieved.",
-                    },
+    The result is shared between calls — treat it as read-only.
+    """
+    return {
+        "name": f"ask_{name}",
+        "description": f"Delegate a task to the {name} agent.\n{description}",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "task": {
+                    "type": "string",
+                    "description": f"The directive/task to give to {name}.",
+                },
+                "new_conversation": {
+                    "type": "boolean",
+                    "description": "Reset agent's session (rarely needed). Default: false.",
                 },
-                "required": ["summary", "success"],
             },
-        }
-    )
+            "required": ["task"],
+        },
+    }
+
+
+def build_team_tools(team: TeamConfig) -> list[dict]:
+    """Build Anthropic-style tool definitions from a team config.
+
+    Tool dicts are cached per ``(name, description)`` and shared across
+    calls, so callers must not mutate them.
+    """
+    tools = [
+        _agent_tool(name, agent.description.strip()) for name, agent in team.items()
+    ]
+    tools.append(_DONE_TOOL)
     return tools
 
 
@@ -393,9 +423,27 @@ class DoneSignal:
         self.success = False
 
 
+# Cap on the previous-progress block carried into the next cycle's prompt
+_PRIOR_SUMMARY_CHARS = 4000
+
+
 def build_cycle_prompt(goal: str, project_dir: Path, prior_summary: str = "") -> str:
-    """Build the user-turn prompt sent to the orchestrator each cycle."""
+    """Build the user-turn prompt sent to the orchestrator each cycle.
+
+    The goal/project header is identical every cycle and always comes first;
+    per-cycle progress is only ever appended after it. Keep it that way —
+    anything variable inserted into the header breaks server-side prompt
+    caching of the shared prefix across cycles.
+
+    A long *prior_summary* (e.g. every agent summary from a cycle that hit
+    the turn limit) keeps only its most recent ``_PRIOR_SUMMARY_CHARS``, so
+    the prompt stays bounded however much a cycle did.
+    """
     prompt = f"# Goal\n\n{goal}\n\nProject directory: {project_dir}"
+    if len(prior_summary) > _PRIOR_SUMMARY_CHARS:
+        prior_summary = (
+            "[… earlier progress omitted]\n" + prior_summary[-_PRIOR_SUMMARY_CHARS:]
+        )
     if prior_summary:
         prompt += (
             f"\n\n# Previous progress\n\n{prior_summary}"
@@ -416,10 +464,56 @@ class VerificationState:
     done_attempt: int = 0
 
 
+# Case-insensitive match for either acceptance signal, without upper-casing
+# a copy of the (often multi-KB) report first
+_ACCEPT_RE = re.compile(
+    f"{re.escape(PASS_SIGNAL)}|{re.escape(MINOR_SIGNAL)}", re.IGNORECASE
+)
+
+
 def _check_passed(report: str) -> bool:
     """Return True if a verifier report signals acceptance."""
-    upper = report.upper()
-    return PASS_SIGNAL in upper or MINOR_SIGNAL in upper
+    # Agents almost always echo the signal verbatim — skip the regex then
+    if PASS_SIGNAL in report or MINOR_SIGNAL in report:
+        return True
+    return _ACCEPT_RE.search(report) is not None
+
+
+# Role-specific instructions appended to the shared verification prompt
+_TESTER_SUFFIX = (
+    "Verify this works end-to-end. Report ONLY issues found. "
+    f"If everything works, say '{PASS_SIGNAL}'."
+)
+_ARCHITECT_SUFFIX = (
+    "Review the codebase for critical bugs, missing features, "
+    "or deviations from the goal. Report ONLY issues found. "
+    f"If everything looks good, say '{PASS_SIGNAL}'."
+)
+_FALLBACK_SUFFIX = (
+    "You are reviewing work done by another agent. "
+    "In a FRESH context, review the codebase changes against the goal. "
+    "Check: does it solve the goal? Is the code correct? Did anything break? "
+    "Run tests if available. Report ONLY issues found. "
+    f"If everything looks good, say '{PASS_SIGNAL}'."
+)
+
+# Caps on how much of a verifier report is logged / quoted back to the orchestrator
+_REPORT_LOG_CHARS = 5000
+_REPORT_ISSUE_CHARS = 3000
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Return *text* cut to *limit* chars, without copying when it already fits."""
+    return text if len(text) <= limit else text[:limit]
+
+
+def _record_report(agent: str, heading: str, report: str, issues: list[str]) -> None:
+    """Log a verifier report and append it to *issues* unless it passed."""
+    log.emit(
+        "done_verification", agent=agent, report=_truncate(report, _REPORT_LOG_CHARS)
+    )
+    if not _check_passed(report):
+        issues.append(f"{heading}\n{_truncate(report, _REPORT_ISSUE_CHARS)}")
 
 
 def verify_done(
@@ -430,18 +524,23 @@ def verify_done(
     *,
     state: VerificationState | None = None,
     browser_testing: bool = False,
+    agent_locks: Mapping[str, threading.Lock] | None = None,
 ) -> str | None:
     """Run tester + architect to verify the goal is met.
 
     Returns None if all checks pass, or a rejection message with issues found.
     *browser_testing*: when False, ``tester_browser`` is skipped even if present
-    in the team.
+    in the team. *agent_locks*: per-agent locks held around each verifier's
+    run, so verification never shares a session with a concurrent delegation.
     """
-    from kodo import log
-
     if state is None:
         state = VerificationState()
 
+    def _run_verifier(name: str, agent: Agent, prompt: str, **kwargs):
+        lock = agent_locks.get(name) if agent_locks else None
+        with lock or nullcontext():
+            return agent.run(prompt, project_dir, **kwargs)
+
     state.done_attempt += 1
     attempt = state.done_attempt
     reset_session = attempt == 1
@@ -462,27 +561,25 @@ def verify_done(
     elif team.get("tester_browser") and not browser_testing:
         log.tprint("[done] skipping tester_browser (not needed for this stage)")
 
+    tester_prompt = f"{verification_prompt}{_TESTER_SUFFIX}"
     for tester_name, tester_agent in tester_agents:
         try:
             log.tprint(
                 f"[done] running {tester_name} verification (attempt {attempt})..."
             )
-            tester_result = tester_agent.run(
-                verification_prompt
-                + "Verify this works end-to-end. Report ONLY issues found. "
-                "If everything works, say 'ALL CHECKS PASS'.",
-                project_dir,
+            tester_result = _run_verifier(
+                tester_name,
+                tester_agent,
+                tester_prompt,
                 new_conversation=reset_session,
                 agent_name=f"{tester_name}_verification",
             )
-            tester_report = tester_result.text or ""
-            log.emit(
-                "done_verification", agent=tester_name, report=tester_report[:5000]
+            _record_report(
+                tester_name,
+                f"**{tester_name} found issues:**",
+                tester_result.text or "",
+                issues,
             )
-            if not _check_passed(tester_report):
-                issues.append(
-                    f"**{tester_name} found issues:**\n{tester_report[:3000]}"
-                )
         except Exception as exc:
             log.emit("done_verification_error", agent=tester_name, error=str(exc))
             issues.append(f"**{tester_name} crashed:** {exc}")
@@ -491,21 +588,19 @@ def verify_done(
     if architect_agent:
         try:
             log.tprint(f"[done] running architect verification (attempt {attempt})...")
-            architect_result = architect_agent.run(
-                verification_prompt
-                + "Review the codebase for critical bugs, missing features, "
-                "or deviations from the goal. Report ONLY issues found. "
-                "If everything looks good, say 'ALL CHECKS PASS'.",
-                project_dir,
+            architect_result = _run_verifier(
+                "architect",
+                architect_agent,
+                f"{verification_prompt}{_ARCHITECT_SUFFIX}",
                 new_conversation=reset_session,
                 agent_name="architect_verification",
             )
-            architect_report = architect_result.text or ""
-            log.emit(
-                "done_verification", agent="architect", report=architect_report[:5000]
+            _record_report(
+                "architect",
+                "**Architect found issues:**",
+                architect_result.text or "",
+                issues,
             )
-            if not _check_passed(architect_report):
-                issues.append(f"**Architect found issues:**\n{architect_report[:3000]}")
         except Exception as exc:
             log.emit("done_verification_error", agent="architect", error=str(exc))
             issues.append(f"**Architect crashed:** {exc}")
@@ -517,41 +612,29 @@ def verify_done(
         or architect_agent is not None
     )
     if not has_dedicated_verifiers:
-        # Prefer worker_smart, fall back to any worker
-        verifier = (
-            team.get("worker_smart")
-            or team.get("worker")
-            or next((a for a in team.values()), None)
+        # Prefer worker_smart, then worker, then whichever agent comes first
+        verifier_name, verifier = next(
+            ((n, team[n]) for n in ("worker_smart", "worker") if team.get(n)),
+            next(iter(team.items()), ("worker", None)),
         )
         if verifier:
-            verifier_name = next(
-                (n for n, a in team.items() if a is verifier), "worker"
-            )
             try:
                 log.tprint(
                     f"[done] running {verifier_name} as verifier (fresh session)..."
                 )
-                verify_result = verifier.run(
-                    verification_prompt
-                    + "You are reviewing work done by another agent. "
-                    "In a FRESH context, review the codebase changes against the goal. "
-                    "Check: does it solve the goal? Is the code correct? Did anything break? "
-                    "Run tests if available. Report ONLY issues found. "
-                    "If everything looks good, say 'ALL CHECKS PASS'.",
-                    project_dir,
+                verify_result = _run_verifier(
+                    verifier_name,
+                    verifier,
+                    f"{verification_prompt}{_FALLBACK_SUFFIX}",
                     new_conversation=True,
                     agent_name=f"{verifier_name}_verification",
                 )
-                verify_report = verify_result.text or ""
-                log.emit(
-                    "done_verification",
-                    agent=verifier_name,
-                    report=verify_report[:5000],
+                _record_report(
+                    verifier_name,
+                    f"**{verifier_name} (verifier) found issues:**",
+                    verify_result.text or "",
+                    issues,
                 )
-                if not _check_passed(verify_report):
-                    issues.append(
-                        f"**{verifier_name} (verifier) found issues:**\n{verify_report[:3000]}"
-                    )
             except Exception as exc:
                 log.emit("done_verification_error", agent=verifier_name, error=str(exc))
                 issues.append(f"**{verifier_name} (verifier) crashed:** {exc}")
@@ -620,6 +703,17 @@ class ResumeState:
     current_stage_cycles: int
 
 
+def _close_agent(name: str, agent: Agent) -> None:
+    """Close *agent*'s session, logging (not raising) any failure.
+
+    One agent failing to close must not leak the remaining sessions.
+    """
+    try:
+        agent.close()
+    except Exception as exc:
+        log.emit("agent_close_error", agent=name, error=str(exc))
+
+
 class Orchestrator(Protocol):
     def cycle(
         self,
@@ -683,7 +777,6 @@ class OrchestratorBase:
         resume: ResumeState | None = None,
         plan: GoalPlan | None = None,
     ) -> RunResult:
-        from kodo import log
         from kodo.sessions.claude import ClaudeSession
         from kodo.sessions.cursor import CursorSession
 
@@ -737,7 +830,7 @@ class OrchestratorBase:
             project_dir=str(project_dir),
             max_exchanges=max_exchanges,
             max_cycles=max_cycles,
-            team=list(team.keys()),
+            team=tuple(team),
             resumed=resume is not None,
             resume_from_cycle=start_cycle if resume else None,
             has_stages=plan is not None and len(plan.stages) > 0,
@@ -769,11 +862,12 @@ class OrchestratorBase:
                     prior_summary=prior_summary,
                 )
         finally:
-            self._summarizer.shutdown()
-
-            # Clean up agent sessions
-            for agent in team.values():
-                agent.close()
+            # Summarizer drain and agent session cleanup are independent,
+            # I/O-bound teardown steps — overlap them instead of serializing.
+            with ThreadPoolExecutor(max_workers=len(team) + 1) as pool:
+                pool.submit(self._shutdown_summarizer)
+                for name, agent in team.items():
+                    pool.submit(_close_agent, name, agent)
 
             # Clean up checkpoints on successful completion
             if result.finished:
@@ -797,12 +891,22 @@ class OrchestratorBase:
             # Open the HTML log viewer for easy inspection
             log_file = log.get_log_file()
             if log_file and log_file.exists() and not os.environ.get("KODO_NO_VIEWER"):
-                from kodo.viewer import open_viewer
-
                 open_viewer(log_file)
 
         return result
 
+    def _shutdown_summarizer(self) -> None:
+        """Stop the summarizer, logging (not raising) any failure.
+
+        Each cycle already drains the summaries it needs before returning, so
+        anything still queued at teardown would never be read: drop it and
+        don't block the rest of teardown on in-flight LLM calls.
+        """
+        try:
+            self._summarizer.shutdown(wait=False, cancel_pending=True)
+        except Exception as exc:
+            log.emit("summarizer_shutdown_error", error=str(exc))
+
     def _run_single(
         self,
         goal: str,
@@ -816,17 +920,15 @@ class OrchestratorBase:
         prior_summary: str,
     ) -> None:
         """Original single-goal execution loop."""
-        from kodo import log
-
+        # Fields shared by every run_cycle event — only the cycle number varies
+        cycle_fields = {
+            "orchestrator": self._orchestrator_name,
+            "max_cycles": max_cycles,
+        }
         for i in range(start_cycle, max_cycles + 1):
             if i > 1:
                 log.tprint(f"\n[orchestrator] === CYCLE {i}/{max_cycles} ===")
-            log.emit(
-                "run_cycle",
-                orchestrator=self._orchestrator_name,
-                cycle=i,
-                max_cycles=max_cycles,
-            )
+            log.emit("run_cycle", cycle=i, **cycle_fields)
 
             cycle_result = self.cycle(
                 goal,
@@ -835,7 +937,7 @@ class OrchestratorBase:
                 max_exchanges=max_exchanges,
                 prior_summary=prior_summary,
             )
-            result.cycles.append(cycle_result)
+            result.add_cycle(cycle_result)
 
             if cycle_result.finished:
                 break
@@ -855,10 +957,12 @@ class OrchestratorBase:
         resume: ResumeState | None = None,
     ) -> None:
         """Staged execution: iterate over plan stages with a shared cycle budget."""
-        from kodo import log
-
         global_cycle = 0
         stage_summaries: list[str] = []
+        cycle_fields = {
+            "orchestrator": self._orchestrator_name,
+            "max_cycles": max_cycles,
+        }
 
         # Resume support: skip completed stages
         start_stage_idx = 0
@@ -905,11 +1009,7 @@ class OrchestratorBase:
                     f"(stage {stage.index}) ==="
                 )
                 log.emit(
-                    "run_cycle",
-                    orchestrator=self._orchestrator_name,
-                    cycle=cycle_num,
-                    max_cycles=max_cycles,
-                    stage_index=stage.index,
+                    "run_cycle", cycle=cycle_num, stage_index=stage.index, **cycle_fields
                 )
 
                 cycle_result = self.cycle(
@@ -921,7 +1021,7 @@ class OrchestratorBase:
                     browser_testing=stage.browser_testing,
                 )
                 cycle_result.stage_index = stage.index
-                result.cycles.append(cycle_result)
+                result.add_cycle(cycle_result)
                 stage_res.cycles.append(cycle_result)
 
                 if cycle_result.finished:
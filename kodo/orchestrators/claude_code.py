@@ -29,82 +29,100 @@ def _build_mcp_server(
     verification_state: VerificationState | None = None,
     browser_testing: bool = False,
 ):
-    """Build a FastMCP server exposing each team agent as a tool."""
+    """Build a FastMCP server with an ``ask`` tool for the team plus ``done``."""
     from mcp.server.fastmcp import FastMCP
 
     mcp = FastMCP("team")
 
-    for name, agent in team.items():
-
-        def _make_handler(agent_name, agent_obj, agent_desc):
-            def handler(task: str, new_conversation: bool = False) -> str:
-                """Delegate a task to this agent."""
-                log.tprint(f"[orchestrator] → {agent_name}: {task[:100]}...")
-                log.emit(
-                    "orchestrator_tool_call",
-                    orchestrator="claude_code",
-                    agent=agent_name,
-                    task=task,
-                    new_conversation=new_conversation,
-                )
+    # An agent owns a single session, so calls to the *same* agent are
+    # serialized; delegations to different agents run concurrently.
+    agent_locks = {name: threading.Lock() for name in team}
+    # done calls run one at a time: they share the verification state
+    done_lock = threading.Lock()
+
+    def _run_agent(agent_name: str, task: str, new_conversation: bool):
+        with agent_locks[agent_name]:
+            return team[agent_name].run(
+                task,
+                project_dir,
+                new_conversation=new_conversation,
+                agent_name=agent_name,
+            )
 
-                if new_conversation:
-                    log.tprint(f"[{agent_name}] new conversation requested")
+    async def ask(agent: str, task: str, new_conversation: bool = False) -> str:
+        if agent not in team:
+            return f"[ERROR] unknown agent {agent!r}; choose one of: {', '.join(team)}"
 
-                try:
-                    result = agent_obj.run(
-                        task,
-                        project_dir,
-                        new_conversation=new_conversation,
-                        agent_name=agent_name,
-                    )
-                except Exception as exc:
-                    error_msg = (
-                        f"[ERROR] {agent_name} crashed: {type(exc).__name__}: {exc}"
-                    )
-                    log.emit("agent_crash", agent=agent_name, error=str(exc))
-                    log.tprint(error_msg)
-                    return error_msg
-
-                report = result.format_report()[:10000]
-                log.emit(
-                    "orchestrator_tool_result",
-                    orchestrator="claude_code",
-                    agent=agent_name,
-                    elapsed_s=result.elapsed_s,
-                    is_error=result.is_error,
-                    context_reset=result.context_reset,
-                    session_tokens=result.session_tokens,
-                    report=report,
-                )
-
-                done_msg = f"[{agent_name}] done ({result.elapsed_s:.1f}s)"
-                if agent_obj.session.cost_bucket != "cursor_subscription":
-                    done_msg += f" | session: {result.session_tokens:,} tokens"
-                log.tprint(done_msg)
-                if result.is_error:
-                    log.tprint(f"[{agent_name}] reported error")
-                if result.context_reset:
-                    log.tprint(
-                        f"[{agent_name}] context reset: {result.context_reset_reason}"
-                    )
-
-                log.print_stats_table()
-
-                summarizer.summarize(agent_name, task, report)
-                return report
-
-            handler.__name__ = f"ask_{agent_name}"
-            handler.__doc__ = (
-                f"Delegate a task to the {agent_name} agent.\n{agent_desc}"
-            )
-            return handler
+        # One tprint per event: concurrent handlers share stdout, so
+        # each progress line is written whole rather than piecemeal.
+        delegate_msg = f"[orchestrator] → {agent}: {task[:100]}..."
+        if new_conversation:
+            delegate_msg += " (new conversation)"
+        log.tprint(delegate_msg)
+        log.emit(
+            "orchestrator_tool_call",
+            orchestrator="claude_code",
+            agent=agent,
+            task=task,
+            new_conversation=new_conversation,
+        )
 
-        mcp.add_tool(
-            _make_handler(name, agent, agent.description.strip()), name=f"ask_{name}"
+        try:
+            # Agent runs are blocking I/O — keep them off the event loop
+            # so the orchestrator's parallel tool calls overlap.
+            result = await asyncio.to_thread(_run_agent, agent, task, new_conversation)
+        except Exception as exc:
+            error_msg = f"[ERROR] {agent} crashed: {type(exc).__name__}: {exc}"
+            log.emit("agent_crash", agent=agent, error=str(exc))
+            log.tprint(error_msg)
+            return error_msg
+
+        report = result.formatted_report[:10000]
+        log.emit(
+            "orchestrator_tool_result",
+            orchestrator="claude_code",
+            agent=agent,
+            elapsed_s=result.elapsed_s,
+            is_error=result.is_error,
+            context_reset=result.context_reset,
+            session_tokens=result.session_tokens,
+            report=report,
         )
 
-    def done(summary: str, success: bool) -> str:
+        done_msg = f"[{agent}] done ({result.elapsed_s:.1f}s)"
+        if team[agent].session.cost_bucket != "cursor_subscription":
+            done_msg += f" | session: {result.session_tokens:,} tokens"
+        if result.is_error:
+            done_msg += " | reported error"
+        if result.context_reset:
+            done_msg += f" | context reset: {result.context_reset_reason}"
+        log.tprint(done_msg)
+
+        log.print_stats_table()
+
+        summarizer.summarize(agent, task, report)
+        return report
+
+    # A single tool for the whole team: the task/new_conversation schema is
+    # sent once per turn instead of once per agent.
+    ask.__doc__ = "Delegate a task to one of the team's agents.\n\nAgents:\n" + "\n".join(
+        f"- {name}: {agent.description.strip()}" for name, agent in team.items()
+    )
+    mcp.add_tool(ask)
+
+    def _verify(summary: str) -> str | None:
+        with done_lock:
+            return verify_done(
+                goal,
+                summary,
+                team,
+                project_dir,
+                state=verification_state,
+                browser_testing=browser_testing,
+                agent_locks=agent_locks,
+            )
+
+    async def done(summary: str, success: bool) -> str:
         """Signal that the goal is complete. Runs automated verification first — \
 if the tester or architect find issues, the call is rejected and you must fix them."""
         log.emit(
@@ -121,14 +139,8 @@ if the tester or architect find issues, the call is rejected and you must fix th
             done_signal.success = False
             return "Acknowledged (marked as unsuccessful)."
 
-        rejection = verify_done(
-            goal,
-            summary,
-            team,
-            project_dir,
-            state=verification_state,
-            browser_testing=browser_testing,
-        )
+        # Verification runs agents too — off the loop, under their locks
+        rejection = await asyncio.to_thread(_verify, summary)
         if rejection:
             log.emit(
                 "orchestrator_done_rejected",
@@ -219,9 +231,11 @@ class ClaudeCodeOrchestrator(OrchestratorBase):
 
         # Run the entire connect→query→collect→disconnect lifecycle in a single
         # async function on a fresh event loop so anyio cancel scopes stay in
-        # the same task throughout.
+        # the same task throughout. The same loop serves the team's MCP tool
+        # calls, so it only receives; logging happens after it returns.
         async def _run_cycle():
             client = ClaudeSDKClient(options=options)
+            final = None
             try:
                 await client.connect()
                 log.tprint("[orchestrator] starting cycle...")
@@ -229,42 +243,13 @@ class ClaudeCodeOrchestrator(OrchestratorBase):
 
                 async for message in client.receive_response():
                     if isinstance(message, ResultMessage):
-                        result.exchanges = message.num_turns or 0
-                        result.total_cost_usd = message.total_cost_usd or 0.0
-                        log.get_run_stats().record_orchestrator(
-                            result.total_cost_usd, "claude_subscription"
-                        )
-                        result.finished = done_signal.called
-                        result.success = done_signal.success
-                        result.summary = (
-                            done_signal.summary
-                            if done_signal.called
-                            else (message.result or "")
-                        )
-                        log.emit(
-                            "orchestrator_response",
-                            orchestrator="claude_code",
-                            is_error=message.is_error,
-                            num_turns=message.num_turns,
-                            cost_usd=message.total_cost_usd,
-                            result_text=message.result,
-                            done_called=done_signal.called,
-                        )
-                        if done_signal.called:
-                            log.tprint(
-                                f"[orchestrator] cycle done (done tool called): {done_signal.summary[:200]}"
-                            )
-                        elif message.is_error:
-                            log.tprint(f"[orchestrator] error: {message.result}")
-                        else:
-                            log.tprint(
-                                "[orchestrator] cycle ended without calling done (hit turn limit?)"
-                            )
+                        final = message
             finally:
                 try:
                     await client.disconnect()
                 except RuntimeError:
                     pass  # anyio cancel scope mismatch on cleanup — harmless
+            return final
 
         # Use a dedicated thread so we never collide with a caller's loop
         loop = asyncio.new_event_loop()
@@ -272,12 +257,43 @@ class ClaudeCodeOrchestrator(OrchestratorBase):
         thread.start()
         try:
             future = asyncio.run_coroutine_threadsafe(_run_cycle(), loop)
-            future.result()  # blocks until cycle completes
+            message = future.result()  # blocks until cycle completes
         finally:
             loop.call_soon_threadsafe(loop.stop)
             thread.join(timeout=5)
             loop.close()
 
+        if message is not None:
+            result.exchanges = message.num_turns or 0
+            result.total_cost_usd = message.total_cost_usd or 0.0
+            log.get_run_stats().record_orchestrator(
+                result.total_cost_usd, "claude_subscription"
+            )
+            result.finished = done_signal.called
+            result.success = done_signal.success
+            result.summary = (
+                done_signal.summary if done_signal.called else (message.result or "")
+            )
+            log.emit(
+                "orchestrator_response",
+                orchestrator="claude_code",
+                is_error=message.is_error,
+                num_turns=message.num_turns,
+                cost_usd=message.total_cost_usd,
+                result_text=message.result,
+                done_called=done_signal.called,
+            )
+            if done_signal.called:
+                log.tprint(
+                    f"[orchestrator] cycle done (done tool called): {done_signal.summary[:200]}"
+                )
+            elif message.is_error:
+                log.tprint(f"[orchestrator] error: {message.result}")
+            else:
+                log.tprint(
+                    "[orchestrator] cycle ended without calling done (hit turn limit?)"
+                )
+
         # If we ran out of turns without calling done, build a summary from
         # the summarizer's accumulated agent reports so the next cycle has context.
         if not result.finished and not result.summary:
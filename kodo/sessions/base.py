@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from kodo.errors import AgentError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryResult:
     text: str
     elapsed_s: float
@@ -147,33 +147,9 @@ class Session(Protocol):
     def reset(self) -> None: ...
 
 
-<<<<<<< HEAD
 # ---------------------------------------------------------------------------
 # Retry strategy for transient failures (429 rate limits, 529 overloads)
 # ---------------------------------------------------------------------------
-=======
-class RetryableSession(Protocol):
-    """Session that supports automatic retry with exponential backoff."""
-    
-    def query_with_retry(
-        self,
-        prompt: str,
-        project_dir: Path,
-        *,
-        max_turns: int,
-        max_retries: int = 3,
-        initial_delay_s: float = 1.0,
-    ) -> QueryResult:
-        """Execute query with automatic retry on retriable errors.
-        
-        Uses exponential backoff with jitter for transient failures.
-        """
-        ...
-
-
-class SubprocessSession:
-    """Base for subprocess-backed sessions (Cursor, Codex, Gemini CLI).
->>>>>>> a7b8d01 (PR #3: Add session retry integration with exponential backoff)
 
 
 @dataclass
@@ -234,7 +210,6 @@ class RetryStrategy:
     ) -> "QueryResult":
         """Call *fn* with retries on transient errors.
 
-<<<<<<< HEAD
         Parameters
         ----------
         fn : callable
@@ -267,22 +242,35 @@ class RetryStrategy:
         # Should never reach here, but satisfy type checker
         assert last_error is not None
         raise last_error
-=======
-    def reset(self) -> None:
-        """Reset shared state.  Subclasses should log, clear their own state,
-        then call ``super().reset()``."""
-        self._stats = SessionStats()
-        self._system_prompt_sent = False
+
+
+class RetryableSession(Protocol):
+    """Session that supports automatic retry with exponential backoff."""
+    
+    def query_with_retry(
+        self,
+        prompt: str,
+        project_dir: Path,
+        *,
+        max_turns: int,
+        max_retries: int = 3,
+        initial_delay_s: float = 1.0,
+    ) -> QueryResult:
+        """Execute query with automatic retry on retriable errors.
+        
+        Uses exponential backoff with jitter for transient failures.
+        """
+        ...
 
 
 class SessionRetryMixin:
     """Mixin to add automatic retry logic with exponential backoff to any session.
     
     Example usage:
-        class MySession(SubprocessSession, SessionRetryMixin):
+        class MySession(SessionRetryMixin):
             def query(self, ...): ...
         
-        session = MySession(model="gpt-4")
+        session = MySession()
         result = session.query_with_retry(prompt, project_dir, max_turns=30)
     """
     
@@ -378,4 +366,3 @@ class SessionRetryMixin:
             turns=0,
             error=last_error,
         )
->>>>>>> a7b8d01 (PR #3: Add session retry integration with exponential backoff)
@@ -6,6 +6,7 @@ import asyncio
 import os
 import threading
 import time
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -20,9 +21,12 @@ def _extract_tokens(usage: dict | None) -> tuple[int | None, int | None]:
     """Pull input/output token counts from the raw usage dict."""
     if not usage:
         return None, None
-    inp = usage.get("input_tokens") or usage.get("prompt_tokens")
-    out = usage.get("output_tokens") or usage.get("completion_tokens")
-    return inp, out
+    # Nested get() rather than ``or``: an explicit 0 is a real count.
+    get = usage.get
+    return (
+        get("input_tokens", get("prompt_tokens")),
+        get("output_tokens", get("completion_tokens")),
+    )
 
 
 class ClaudeSession:
@@ -202,47 +206,47 @@ class ClaudeSession:
         )
 
         t0 = time.monotonic()
-        self._run(self._client.query(prompt))
 
-        result = QueryResult(text="", elapsed_s=0.0)
-
-        async def _collect():
-            nonlocal result
+        # Send and collect in one coroutine: a single hop onto the background
+        # loop per query instead of one for the send and one for the replies.
+        # The loop only receives; bookkeeping happens back on this thread.
+        async def _query_and_collect():
+            final = None
+            await self._client.query(prompt)
             async for message in self._client.receive_response():
                 if isinstance(message, ResultMessage):
-                    inp, out = _extract_tokens(message.usage)
-                    result = QueryResult(
-                        text=message.result or "",
-                        elapsed_s=time.monotonic() - t0,
-                        turns=message.num_turns,
-                        cost_usd=message.total_cost_usd,
-                        is_error=message.is_error,
-                        input_tokens=inp,
-                        output_tokens=out,
-                        usage_raw=message.usage,
-                    )
-                    if hasattr(message, "session_id") and message.session_id:
-                        self._session_id = message.session_id
-                    self._stats.queries += 1
-                    self._stats.total_input_tokens += inp or 0
-                    self._stats.total_output_tokens += out or 0
-                    self._stats.total_cost_usd += message.total_cost_usd or 0.0
-
-        self._run(_collect())
+                    final = message
+            return final
+
+        message = self._run(_query_and_collect())
+        result = QueryResult(text="", elapsed_s=0.0)
+        if message is not None:
+            inp, out = _extract_tokens(message.usage)
+            result = QueryResult(
+                text=message.result or "",
+                elapsed_s=time.monotonic() - t0,
+                turns=message.num_turns,
+                cost_usd=message.total_cost_usd,
+                is_error=message.is_error,
+                input_tokens=inp,
+                output_tokens=out,
+                usage_raw=message.usage,
+            )
+            if getattr(message, "session_id", None):
+                self._session_id = message.session_id
+            self._stats.queries += 1
+            self._stats.total_input_tokens += inp or 0
+            self._stats.total_output_tokens += out or 0
+            self._stats.total_cost_usd += message.total_cost_usd or 0.0
 
         # If a plan was captured during this query, prepend it to the result
         # so the orchestrator can see and review it.
         if self._pending_plan:
-            result = QueryResult(
+            result = replace(
+                result,
                 text=f"[PROPOSED PLAN]\n{self._pending_plan}\n\n"
                 f"[Agent is in plan mode, awaiting review]\n{result.text}",
-                elapsed_s=result.elapsed_s,
-                turns=result.turns,
-                cost_usd=result.cost_usd,
                 is_error=False,  # Not an error — plan review is expected
-                input_tokens=result.input_tokens,
-                output_tokens=result.output_tokens,
-                usage_raw=result.usage_raw,
             )
 
         log.emit(
@@ -2,15 +2,36 @@
 
 from __future__ import annotations
 
-import json
+import shutil
 import subprocess
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 
+try:  # orjson is an optional speedup for parsing the stream-json output
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from kodo import log
 from kodo.sessions.base import QueryResult, SessionStats
 
+# cursor-agent can emit thousands of stream-json events per query; read the
+# pipe in large binary chunks and decode lines as bytes.
+_STDOUT_BUFSIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _cursor_agent_executable() -> str:
+    """Resolve the cursor-agent binary once instead of searching PATH per query.
+
+    cursor-agent's print mode (``-p``) is one-shot — the prompt is an argv
+    argument and the process exits after the result — so each query still
+    spawns a process; conversation continuity comes from ``--resume``.
+    """
+    return shutil.which("cursor-agent") or "cursor-agent"
+
 
 class CursorSession:
     def __init__(
@@ -56,7 +77,7 @@ class CursorSession:
             self._system_prompt_sent = True
 
         cmd = [
-            "cursor-agent",
+            _cursor_agent_executable(),
             "-p",
             "-f",
             "--output-format",
@@ -87,12 +108,15 @@ class CursorSession:
         raw_messages: list[dict] = []
 
         proc = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8"
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=_STDOUT_BUFSIZE,
         )
 
         # Drain stderr in a background thread to avoid deadlock when the
         # OS pipe buffer fills up while we're reading stdout.
-        stderr_chunks: list[str] = []
+        stderr_chunks: list[bytes] = []
 
         def _drain_stderr():
             for line in proc.stderr:
@@ -103,11 +127,14 @@ class CursorSession:
 
         for line in proc.stdout:
             line = line.strip()
-            if not line:
+            # Every stream-json event is an object; skip blanks and stray output.
+            # Events are decoded even when they carry no result or chat id:
+            # session_query_end logs them all as raw_messages.
+            if not line.startswith(b"{"):
                 continue
             try:
-                msg = json.loads(line)
-            except json.JSONDecodeError:
+                msg = _json_loads(line)
+            except ValueError:
                 continue
 
             raw_messages.append(msg)
@@ -128,7 +155,9 @@ class CursorSession:
         elapsed = time.monotonic() - t0
 
         is_error = proc.returncode != 0
-        stderr_text = "".join(stderr_chunks) if is_error else ""
+        stderr_text = (
+            b"".join(stderr_chunks).decode("utf-8", errors="replace") if is_error else ""
+        )
 
         self._stats.queries += 1
 
@@ -6,15 +6,28 @@ then Gemini, then falls back to simple truncation.
 
 from __future__ import annotations
 
+import hashlib
+import http.client
 import json
 import os
+import queue
+import socket
 import threading
+import urllib.parse
 import urllib.request
 import urllib.error
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 
 from kodo import log
 
+# Max LLM summaries remembered by input hash (oldest evicted first)
+_CACHE_SIZE = 1024
+
+# ollama's default bind address. An IP rather than "localhost", so the probe
+# and the requests don't first try (and time out on) an unbound ::1.
+_OLLAMA_ADDR = ("127.0.0.1", 11434)
+_OLLAMA_URL = f"http://{_OLLAMA_ADDR[0]}:{_OLLAMA_ADDR[1]}"
+
 _PROMPT_TEMPLATE = (
     "Summarize in 1 sentence what was accomplished. "
     "Be specific (mention file names, features, decisions). No preamble.\n\n"
@@ -23,10 +36,78 @@ _PROMPT_TEMPLATE = (
 )
 
 
+class _HTTPPool:
+    """Keep-alive HTTP(S) connections, one per host, reused across requests.
+
+    Saves a TCP (and for Gemini, TLS) handshake per summary. Not thread-safe:
+    only the summarizer's single worker thread uses it.
+    """
+
+    def __init__(self, timeout: float = 30) -> None:
+        self._timeout = timeout
+        self._conns: dict[tuple[str, str], http.client.HTTPConnection] = {}
+
+    def post_json(self, url: str, payload: dict) -> dict:
+        """POST *payload* as JSON and return the decoded JSON response."""
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        body = json.dumps(payload).encode()
+        reused = (parts.scheme, parts.netloc) in self._conns
+        try:
+            status, data = self._post(parts, path, body)
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            if not reused:
+                raise
+            # The server closed the idle pooled connection — retry once on a
+            # fresh one. Timeouts and other errors are real failures.
+            status, data = self._post(parts, path, body)
+        if status >= 400:
+            raise RuntimeError(f"HTTP {status} from {parts.netloc}")
+        return json.loads(data)
+
+    def _post(
+        self, parts: urllib.parse.SplitResult, path: str, body: bytes
+    ) -> tuple[int, bytes]:
+        key = (parts.scheme, parts.netloc)
+        conn = self._conns.get(key)
+        if conn is None:
+            conn_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = self._conns[key] = conn_cls(parts.netloc, timeout=self._timeout)
+        try:
+            conn.request(
+                "POST", path, body=body, headers={"Content-Type": "application/json"}
+            )
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            del self._conns[key]
+            raise
+
+    def close(self) -> None:
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+
+
 def _probe_ollama() -> str | None:
     """Return the first available ollama model name, or None."""
     try:
-        req = urllib.request.Request("http://localhost:11434/api/tags", method="GET")
+        # Fail fast when nothing listens on the port instead of waiting out
+        # the HTTP timeout below.
+        socket.create_connection(_OLLAMA_ADDR, timeout=0.2).close()
+    except OSError:
+        return None
+    try:
+        req = urllib.request.Request(f"{_OLLAMA_URL}/api/tags", method="GET")
         with urllib.request.urlopen(req, timeout=2) as resp:
             data = json.loads(resp.read())
         models = data.get("models", [])
@@ -42,45 +123,31 @@ def _probe_gemini() -> str | None:
     return os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY") or None
 
 
-def _summarize_ollama(model: str, task: str, report: str) -> str:
+def _summarize_ollama(http: _HTTPPool, model: str, task: str, report: str) -> str:
     prompt = _PROMPT_TEMPLATE.format(task=task[:200], report=report[:2000])
-    payload = json.dumps(
+    data = http.post_json(
+        f"{_OLLAMA_URL}/api/generate",
         {
             "model": model,
             "prompt": prompt,
             "stream": False,
-        }
-    ).encode()
-    req = urllib.request.Request(
-        "http://localhost:11434/api/generate",
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
+        },
     )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        data = json.loads(resp.read())
     return data.get("response", "").strip()
 
 
-def _summarize_gemini(api_key: str, task: str, report: str) -> str:
+def _summarize_gemini(http: _HTTPPool, api_key: str, task: str, report: str) -> str:
     prompt = _PROMPT_TEMPLATE.format(task=task[:200], report=report[:2000])
     url = (
         "https://generativelanguage.googleapis.com/v1beta/models/"
         f"gemini-2.0-flash-lite:generateContent?key={api_key}"
     )
-    payload = json.dumps(
+    data = http.post_json(
+        url,
         {
             "contents": [{"parts": [{"text": prompt}]}],
-        }
-    ).encode()
-    req = urllib.request.Request(
-        url,
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
+        },
     )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        data = json.loads(resp.read())
     candidates = data.get("candidates", [])
     if candidates:
         parts = candidates[0].get("content", {}).get("parts", [])
@@ -101,13 +168,25 @@ class Summarizer:
     """Fire-and-forget task summarizer using a background thread."""
 
     def __init__(self) -> None:
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # One long-lived worker drains the queue; None is the stop sentinel.
+        self._queue: queue.Queue[tuple[str, str, str] | None] = queue.Queue()
+        self._stopped = False
         self._backend: str = "truncate"
         self._backend_param: str | None = None
         self._summaries: list[str] = []
         self._lock = threading.Lock()
+        self._http = _HTTPPool()
+        # LLM summaries keyed by a hash of the (truncated) prompt inputs, so
+        # repeated reports ("no changes", retried tasks) skip the round-trip.
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+
+        # Backends are probed on the worker thread, ahead of any queued job,
+        # so constructing a Summarizer never blocks on the network.
+        self._backend_ready = threading.Event()
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
 
-        # Probe backends once at init
+    def _probe_backend(self) -> None:
         ollama_model = _probe_ollama()
         if ollama_model:
             self._backend = "ollama"
@@ -124,16 +203,32 @@ class Summarizer:
 
     def summarize(self, agent_name: str, task: str, report: str) -> None:
         """Submit a summary job (fire-and-forget)."""
-        self._executor.submit(self._do_summarize, agent_name, task, report)
+        if not self._stopped:
+            self._queue.put((agent_name, task, report))
+
+    def _work(self) -> None:
+        try:
+            self._probe_backend()
+        except Exception:
+            pass  # stay on truncation — summaries are best-effort
+        finally:
+            self._backend_ready.set()
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    self._http.close()
+                    return
+                self._do_summarize(*job)
+            finally:
+                self._queue.task_done()
 
     def _do_summarize(self, agent_name: str, task: str, report: str) -> None:
         try:
-            if self._backend == "ollama":
-                text = _summarize_ollama(self._backend_param, task, report)
-            elif self._backend == "gemini":
-                text = _summarize_gemini(self._backend_param, task, report)
-            else:
+            if self._backend == "truncate":
                 text = _summarize_truncate(report)
+            else:
+                text = self._summarize_llm(task, report)
 
             if text:
                 with self._lock:
@@ -143,12 +238,33 @@ class Summarizer:
             # Never crash — summaries are best-effort
             pass
 
+    def _summarize_llm(self, task: str, report: str) -> str:
+        # Same truncation as _PROMPT_TEMPLATE gets, so equal prompts share a key
+        key = hashlib.sha256(
+            f"{task[:200]}\x00{report[:2000]}".encode()
+        ).digest()[:16]
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        if self._backend == "ollama":
+            text = _summarize_ollama(self._http, self._backend_param, task, report)
+        else:
+            text = _summarize_gemini(self._http, self._backend_param, task, report)
+
+        if text:
+            with self._lock:
+                self._cache[key] = text
+                if len(self._cache) > _CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return text
+
     def get_accumulated_summary(self) -> str:
         """Drain pending work and return all summaries collected."""
-        # Wait for in-flight tasks to finish before reading
-        self._executor.shutdown(wait=True)
-        # Restart executor for future use
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Wait for queued and in-flight jobs; the worker keeps running
+        self._queue.join()
         with self._lock:
             return "\n".join(self._summaries)
 
@@ -157,6 +273,22 @@ class Summarizer:
         with self._lock:
             self._summaries.clear()
 
-    def shutdown(self, wait: bool = True) -> None:
-        """Drain pending work."""
-        self._executor.shutdown(wait=wait)
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Drain pending work.
+
+        With *cancel_pending*, queued jobs that have not started are dropped
+        instead of run — use at end of run, when nobody will read them.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        if cancel_pending:
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+        self._queue.put(None)
+        if wait:
+            self._worker.join()
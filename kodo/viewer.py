@@ -13,23 +13,39 @@ import webbrowser
 from pathlib import Path
 
 _VIEWER_HTML = Path(__file__).parent / "viewer.html"
-_EMBED_MARKER = "/*__EMBED_MARKER__*/"
+_EMBED_MARKER = b"/*__EMBED_MARKER__*/"
+
+
+def _embed_events(log_path: Path) -> bytes:
+    """Build the ``EMBEDDED_DATA = [...];`` statement from a JSONL log.
+
+    Log lines are already JSON objects, so they are joined into an array
+    as-is instead of being parsed and re-serialized. A line that doesn't
+    look like a complete object (e.g. truncated by a crash mid-write)
+    falls back to the parse-and-dump path, which drops it.
+    """
+    lines = [line.strip() for line in log_path.read_bytes().splitlines()]
+    lines = [line for line in lines if line]
+    if not all(line[:1] == b"{" and line[-1:] == b"}" for line in lines):
+        events = []
+        for line in lines:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+        lines = [json.dumps(event).encode() for event in events]
+    embed = b"EMBEDDED_DATA = [" + b",".join(lines) + b"];"
+    # Escape </script> so HTML parser doesn't close the script tag early
+    return embed.replace(b"</script>", b"<\\/script>")
 
 
 def open_viewer(log_path: Path | None = None) -> None:
-    template = _VIEWER_HTML.read_text(encoding="utf-8")
+    html = _VIEWER_HTML.read_bytes()
 
     if log_path is not None:
-        lines = log_path.read_text(encoding="utf-8").strip().splitlines()
-        events = [json.loads(line) for line in lines]
-        embed = f"EMBEDDED_DATA = {json.dumps(events)};"
-        # Escape </script> so HTML parser doesn't close the script tag early
-        embed = embed.replace("</script>", "<\\/script>")
-        html = template.replace(_EMBED_MARKER, embed)
-    else:
-        html = template
+        html = html.replace(_EMBED_MARKER, _embed_events(log_path))
 
-    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+    with tempfile.NamedTemporaryFile("wb", suffix=".html", delete=False) as f:
         f.write(html)
         tmp = f.name
 
@@ -10,6 +10,7 @@ import pytest
 from kodo import log
 from kodo.agent import Agent
 from kodo.sessions.base import QueryResult, SessionStats
+from tests.mocks.claude_sdk import MockClaudeSDKClient, fake_sdk_modules
 
 
 @pytest.fixture(autouse=True)
@@ -71,6 +72,21 @@ def tmp_project(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def shared_project(tmp_path_factory) -> Path:
+    """A project directory shared by a module's tests.
+
+    For tests whose only writes are log files under distinct run ids.
+    """
+    return tmp_path_factory.mktemp("project")
+
+
+@pytest.fixture(scope="session")
+def fake_sdk():
+    """Fake ``claude_agent_sdk`` modules, built once; tests set ClaudeSDKClient."""
+    return fake_sdk_modules(MockClaudeSDKClient)
+
+
 # ── Shared fakes for API orchestrator tests ─────────────────────────────
 
 
@@ -90,3 +106,13 @@ class FakeRunResult:
 
     def all_messages(self):
         return []
+
+
+@pytest.fixture(scope="module")
+def fake_team():
+    """A one-worker team for API orchestrator cycles, shared per module.
+
+    The orchestrator never mutates the team, so tests can share it.
+    """
+    session = FakeSession(response_text="ok")
+    return {"worker": Agent(session, "test agent", max_turns=5)}
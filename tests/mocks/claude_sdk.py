@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from types import ModuleType
+from typing import Any, Callable
+
+
+# Shared by every MockResultMessage that doesn't pass its own usage. Kept a
+# real dict (like the SDK's) rather than a read-only proxy so it logs and
+# serializes the same way; nothing reading it may mutate it.
+_DEFAULT_USAGE = {"input_tokens": 100, "output_tokens": 50}
 
 
 @dataclass
@@ -14,12 +21,11 @@ class MockResultMessage:
     is_error: bool = False
     num_turns: int | None = 1
     total_cost_usd: float | None = 0.0
-    usage: dict | None = field(
-        default_factory=lambda: {
-            "input_tokens": 100,
-            "output_tokens": 50,
-        }
-    )
+    usage: dict | None = field(default_factory=lambda: _DEFAULT_USAGE)
+
+
+# What a client replays when given no responses; only ever iterated
+_DEFAULT_RESPONSES = (MockResultMessage(),)
 
 
 class MockPermissionResultAllow:
@@ -56,7 +62,7 @@ class MockClaudeSDKClient:
         responses: list[MockResultMessage] | None = None,
     ):
         self.options = options
-        self._responses = responses or [MockResultMessage()]
+        self._responses = responses or _DEFAULT_RESPONSES
         self.queries: list[str] = []
         self.connected = False
         self.disconnected = False
@@ -74,3 +80,25 @@ class MockClaudeSDKClient:
         """Async generator yielding scripted MockResultMessage list."""
         for msg in self._responses:
             yield msg
+
+
+# Holds nothing per test, so one instance serves every fake_sdk_modules() call
+_FAKE_TYPES = ModuleType("claude_agent_sdk.types")
+_FAKE_TYPES.PermissionResultAllow = MockPermissionResultAllow
+_FAKE_TYPES.PermissionResultDeny = MockPermissionResultDeny
+
+
+def fake_sdk_modules(client_factory: Callable[..., Any]) -> dict[str, ModuleType]:
+    """Build fake ``claude_agent_sdk`` modules for ``patch.dict(sys.modules, ...)``.
+
+    *client_factory* stands in for ``ClaudeSDKClient(options=...)``. Clients
+    record their calls, so tests pass a fresh one (or a factory making them)
+    rather than sharing instances. The top-level module carries the factory,
+    so it is built per call; the ``types`` submodule is shared.
+    """
+    fake_mod = ModuleType("claude_agent_sdk")
+    fake_mod.ClaudeAgentOptions = MockClaudeAgentOptions
+    fake_mod.ClaudeSDKClient = client_factory
+    fake_mod.ResultMessage = MockResultMessage
+
+    return {"claude_agent_sdk": fake_mod, "claude_agent_sdk.types": _FAKE_TYPES}
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import io
 import json
 from typing import Any
 
 
+@functools.lru_cache(maxsize=64)
+def _result_line(result_text: str, chat_id: str) -> bytes:
+    """The encoded result line; tests reuse a handful of text/chat id pairs."""
+    # Same text json.dumps(result_msg) would give; only the two string
+    # values need escaping, so skip serializing the whole dict.
+    return (
+        f'{{"type": "result", "result": {json.dumps(result_text)}, '
+        f'"chatId": {json.dumps(chat_id)}, "duration_ms": 1234}}\n'
+    ).encode("utf-8")
+
+
 class MockCursorProcess:
     """Mimics subprocess.Popen for cursor-agent.
 
     Produces stream-json lines on stdout including a result message
-    with configurable result_text, chat_id, and returncode.
+    with configurable result_text, chat_id, and returncode; with
+    ``include_result=False`` stdout is just *extra_messages*. Like the real
+    binary pipes CursorSession opens, stdout and stderr yield bytes lines;
+    stdout is a plain list of them.
     """
 
     def __init__(
@@ -22,13 +37,16 @@ class MockCursorProcess:
         chat_id: str = "chat-abc-123",
         returncode: int = 0,
         extra_messages: list[dict[str, Any]] | None = None,
+        include_result: bool = True,
         stderr_text: str = "",
         **kwargs: Any,
     ):
         self.cmd = cmd
         self.returncode = returncode
-        self._build_stdout(result_text, chat_id, extra_messages or [])
-        self.stderr = io.StringIO(stderr_text)
+        self._build_stdout(
+            result_text, chat_id, extra_messages or [], include_result
+        )
+        self.stderr = io.BytesIO(stderr_text.encode("utf-8"))
         self.pid = 12345
 
     def _build_stdout(
@@ -36,18 +54,14 @@ class MockCursorProcess:
         result_text: str,
         chat_id: str,
         extra_messages: list[dict[str, Any]],
+        include_result: bool,
     ) -> None:
-        lines: list[str] = []
-        for msg in extra_messages:
-            lines.append(json.dumps(msg))
-        result_msg = {
-            "type": "result",
-            "result": result_text,
-            "chatId": chat_id,
-            "duration_ms": 1234,
-        }
-        lines.append(json.dumps(result_msg))
-        self.stdout = io.StringIO("\n".join(lines) + "\n")
+        # CursorSession only iterates stdout, so the pre-split lines will do
+        self.stdout = [
+            f"{json.dumps(msg)}\n".encode("utf-8") for msg in extra_messages
+        ]
+        if include_result:
+            self.stdout.append(_result_line(result_text, chat_id))
 
     def wait(self) -> int:
         return self.returncode
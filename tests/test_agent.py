@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from pathlib import Path
 
+import pytest
+
 from kodo.agent import Agent, AgentResult
 from kodo.sessions.base import QueryResult
 from tests.conftest import FakeSession, make_agent
@@ -25,18 +28,22 @@ def test_agent_new_conversation_resets_session(tmp_project: Path) -> None:
     assert agent.session.reset_count == 1
 
 
-def test_agent_context_reset_flag(tmp_project: Path) -> None:
+@pytest.mark.parametrize(
+    "new_conversation,expect_reset,reason_contains",
+    [(False, False, ""), (True, True, "new conversation")],
+    ids=["default", "new_conversation"],
+)
+def test_agent_context_reset_flag(
+    tmp_project: Path, new_conversation, expect_reset, reason_contains
+) -> None:
     agent = make_agent("ok")
-    result = agent.run("task", tmp_project, new_conversation=True, agent_name="test")
-    assert result.context_reset is True
-    assert "new conversation" in result.context_reset_reason
-
-
-def test_agent_no_reset_by_default(tmp_project: Path) -> None:
-    agent = make_agent("ok")
-    result = agent.run("task", tmp_project, agent_name="test")
-    assert result.context_reset is False
-    assert result.context_reset_reason == ""
+    result = agent.run(
+        "task", tmp_project, new_conversation=new_conversation, agent_name="test"
+    )
+    assert result.context_reset is expect_reset
+    assert reason_contains in result.context_reset_reason
+    # A reason is given exactly when the context was reset
+    assert bool(result.context_reset_reason) is expect_reset
 
 
 def test_agent_session_stats_accumulate(tmp_project: Path) -> None:
@@ -52,28 +59,39 @@ def test_agent_error_propagated(tmp_project: Path) -> None:
     assert result.is_error is True
 
 
-class _SlowSession(FakeSession):
-    """Session that sleeps for a configurable duration."""
+class _BlockingSession(FakeSession):
+    """Session whose query blocks until *release* is set; reset() sets it.
 
-    def __init__(self, delay: float, **kwargs):
+    Stands in for a session whose reset() aborts the in-flight query.
+    """
+
+    def __init__(self, release: threading.Event, **kwargs):
         super().__init__(**kwargs)
-        self._delay = delay
+        self._release = release
 
     def query(self, prompt, project_dir, *, max_turns):
-        time.sleep(self._delay)
+        self._release.wait(timeout=5)
         return super().query(prompt, project_dir, max_turns=max_turns)
 
+    def reset(self) -> None:
+        self._release.set()
+        super().reset()
+
 
 def test_agent_timeout_returns_error(tmp_project: Path) -> None:
-    session = _SlowSession(delay=2.0, response_text="too slow")
-    agent = Agent(session, "slow agent", max_turns=5, timeout_s=0.1)
+    session = _BlockingSession(threading.Event(), response_text="too slow")
+    agent = Agent(session, "slow agent", max_turns=5, timeout_s=0.05)
+    t0 = time.monotonic()
     result = agent.run("do something", tmp_project, agent_name="test")
+    assert time.monotonic() - t0 < 1.0  # reset() cut the query short
     assert result.is_error is True
     assert "timed out" in result.text.lower()
 
 
 def test_agent_no_timeout_when_fast(tmp_project: Path) -> None:
-    session = _SlowSession(delay=0.0, response_text="fast")
+    release = threading.Event()
+    release.set()
+    session = _BlockingSession(release, response_text="fast")
     agent = Agent(session, "fast agent", max_turns=5, timeout_s=5.0)
     result = agent.run("do something", tmp_project, agent_name="test")
     assert not result.is_error
@@ -120,3 +138,14 @@ class TestAgentResult:
         ar = AgentResult(query=qr)
         report = ar.format_report()
         assert "(no output)" in report
+
+    def test_formatted_report_built_once(self) -> None:
+        from unittest.mock import patch
+
+        ar = AgentResult(query=QueryResult(text="All done", elapsed_s=1.0))
+        with patch.object(
+            AgentResult, "format_report", autospec=True, return_value="report"
+        ) as fmt:
+            assert ar.formatted_report == "report"
+            assert ar.formatted_report == "report"
+        assert fmt.call_count == 1
@@ -1,8 +1,7 @@
 """Tests for ApiGenerator."""
 
 import json
-import tempfile
-from pathlib import Path
+from dataclasses import replace
 
 import pytest
 
@@ -16,14 +15,7 @@ from kodo.requirements_parser import (
 )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_spec():
     """Create a basic test specification."""
     return Spec(
@@ -44,6 +36,58 @@ def basic_spec():
     )
 
 
+@pytest.fixture(scope="module")
+def minimal_spec():
+    """Bare express spec; tests ``replace()`` in the fields they exercise."""
+    return Spec(
+        project_name="App",
+        description="Test",
+        features=[],
+        tech_stack=[],
+        database=None,
+        auth=None,
+        frontend_framework=None,
+        backend_framework="express",
+        deployment_target=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def generators():
+    """One generator per framework — ApiGenerator holds no per-call state."""
+    return {
+        framework: ApiGenerator(framework)
+        for framework in ("express", "fastapi", "django", "unsupported")
+    }
+
+
+@pytest.fixture(scope="module")
+def express_gen(generators):
+    return generators["express"]
+
+
+@pytest.fixture(scope="module")
+def basic_routes(basic_spec, express_gen):
+    """Routes for basic_spec — generation is pure, so build them once.
+
+    Route generation doesn't depend on the framework; tests only read this list.
+    """
+    return express_gen.generate_routes_from_spec(basic_spec)
+
+
+def _index_routes(routes):
+    """Group routes by path in one pass."""
+    index = {}
+    for route in routes:
+        index.setdefault(route.path, []).append(route)
+    return index
+
+
+@pytest.fixture(scope="module")
+def basic_routes_by_path(basic_routes):
+    return _index_routes(basic_routes)
+
+
 class TestApiGenerator:
     """Test suite for ApiGenerator."""
 
@@ -52,57 +96,42 @@ class TestApiGenerator:
         gen = ApiGenerator("express")
         assert gen.framework == "express"
 
-    def test_generate_routes_health_check(self, basic_spec):
+    def test_generate_routes_health_check(self, basic_routes_by_path):
         """Test that health check route is always generated."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(basic_spec)
-
-        health_routes = [r for r in routes if r.path == "/health"]
+        health_routes = basic_routes_by_path["/health"]
         assert len(health_routes) == 1
         assert health_routes[0].method == "GET"
         assert health_routes[0].authentication_required is False
 
-    def test_generate_routes_with_jwt_auth(self, basic_spec):
+    def test_generate_routes_with_jwt_auth(self, basic_routes_by_path):
         """Test that JWT routes are generated."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(basic_spec)
-
-        paths = {r.path for r in routes}
+        paths = basic_routes_by_path.keys()
         assert "/auth/register" in paths
         assert "/auth/login" in paths
         assert "/auth/profile" in paths
 
-    def test_generate_routes_with_oauth_providers(self):
+    @pytest.mark.parametrize(
+        "providers",
+        [["google"], ["google", "github"], ["google", "github", "microsoft"]],
+        ids=["one", "two", "three"],
+    )
+    def test_generate_routes_with_oauth_providers(
+        self, express_gen, minimal_spec, providers
+    ):
         """Test that OAuth provider routes are generated."""
-        spec = Spec(
-            project_name="OAuthApp",
-            description="OAuth test app",
-            features=[],
-            tech_stack=[],
-            database=None,
-            auth=AuthConfig(auth_type="oauth2", providers=["google", "github"]),
-            frontend_framework=None,
-            backend_framework="express",
-            deployment_target=None,
+        spec = replace(
+            minimal_spec, auth=AuthConfig(auth_type="oauth2", providers=providers)
         )
 
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(spec)
+        routes = express_gen.generate_routes_from_spec(spec)
 
-        paths = {r.path for r in routes}
-        assert "/auth/google/callback" in paths
-        assert "/auth/github/callback" in paths
+        callbacks = {r.path for r in routes if r.path.endswith("/callback")}
+        assert callbacks == {f"/auth/{p}/callback" for p in providers}
 
-    def test_generate_routes_for_features(self, basic_spec):
+    def test_generate_routes_for_features(self, basic_routes):
         """Test that CRUD routes are generated for features."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(basic_spec)
-
-        # Should have routes for the features
-        paths = {r.path for r in routes}
-
         # Should have multiple routes (health, auth, features)
-        assert len(routes) > 5
+        assert len(basic_routes) > 5
 
     def test_api_route_dataclass(self):
         """Test ApiRoute dataclass creation."""
@@ -130,53 +159,30 @@ class TestApiGenerator:
         assert route.request_body is not None
         assert "name" in route.request_body
 
-    def test_generate_express_code(self, temp_dir, basic_spec):
-        """Test Express code generation."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(basic_spec)
-        code = gen.generate_code(routes, temp_dir / "routes.ts")
-
-        assert code is not None
-        assert "express" in code
-        assert "Router" in code
-        assert "router.get" in code or "router.post" in code
+    @pytest.mark.parametrize(
+        "framework,filename,needles",
+        [
+            ("express", "routes.ts", ("express", "Router", "router.get")),
+            ("fastapi", "routes.py", ("APIRouter", "@router")),
+            ("django", "views.py", ("JsonResponse", "@require_http_methods")),
+        ],
+        ids=["express", "fastapi", "django"],
+    )
+    def test_generate_code(
+        self, generators, tmp_path, basic_routes, framework, filename, needles
+    ):
+        """Test code generation for each framework, returned and written to file."""
+        code = generators[framework].generate_code(basic_routes, tmp_path / filename)
 
-    def test_generate_express_code_writes_file(self, temp_dir, basic_spec):
-        """Test that Express code is written to file."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(basic_spec)
-        gen.generate_code(routes, temp_dir / "routes.ts")
-
-        route_file = temp_dir / "routes.ts"
-        assert route_file.exists()
-        content = route_file.read_text()
-        assert len(content) > 0
-
-    def test_generate_fastapi_code(self, temp_dir, basic_spec):
-        """Test FastAPI code generation."""
-        gen = ApiGenerator("fastapi")
-        routes = gen.generate_routes_from_spec(basic_spec)
-        code = gen.generate_code(routes, temp_dir / "routes.py")
-
-        assert code is not None
-        assert "fastapi" in code or "APIRouter" in code
-        assert "@router" in code
-
-    def test_generate_django_code(self, temp_dir, basic_spec):
-        """Test Django code generation."""
-        gen = ApiGenerator("django")
-        routes = gen.generate_routes_from_spec(basic_spec)
-        code = gen.generate_code(routes, temp_dir / "views.py")
-
-        assert code is not None
-        assert "JsonResponse" in code
-        assert "@require_http_methods" in code
+        for needle in needles:
+            assert needle in code
+        assert (tmp_path / filename).read_text() == code
 
-    def test_generate_schema_json(self, temp_dir, basic_spec):
+    def test_generate_schema_json(self, express_gen, tmp_path, basic_routes):
         """Test OpenAPI schema generation."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(basic_spec)
-        schema = gen.generate_schema_json(routes, temp_dir / "openapi.json")
+        schema = express_gen.generate_schema_json(
+            basic_routes, tmp_path / "openapi.json"
+        )
 
         # Verify it's valid JSON
         schema_data = json.loads(schema)
@@ -184,11 +190,11 @@ class TestApiGenerator:
         assert schema_data["openapi"] == "3.0.0"
         assert "paths" in schema_data
 
-    def test_schema_includes_all_routes(self, temp_dir, basic_spec):
+    def test_schema_includes_all_routes(self, express_gen, tmp_path, basic_routes):
         """Test that schema includes all routes."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(basic_spec)
-        schema = gen.generate_schema_json(routes, temp_dir / "openapi.json")
+        schema = express_gen.generate_schema_json(
+            basic_routes, tmp_path / "openapi.json"
+        )
 
         schema_data = json.loads(schema)
         paths = schema_data["paths"]
@@ -199,9 +205,8 @@ class TestApiGenerator:
         # Should have /auth routes
         assert any("/auth" in path for path in paths)
 
-    def test_schema_includes_descriptions(self, temp_dir, basic_spec):
+    def test_schema_includes_descriptions(self, express_gen, tmp_path):
         """Test that schema includes descriptions."""
-        gen = ApiGenerator("express")
         routes = [
             ApiRoute(
                 path="/test",
@@ -211,14 +216,14 @@ class TestApiGenerator:
             )
         ]
 
-        schema = gen.generate_schema_json(routes, temp_dir / "openapi.json")
+        schema = express_gen.generate_schema_json(routes, tmp_path / "openapi.json")
         schema_data = json.loads(schema)
 
         assert schema_data["paths"]["/test"]["get"]["description"] == "This is a test route"
 
-    def test_unsupported_framework_raises_error(self, temp_dir):
+    def test_unsupported_framework_raises_error(self, generators, tmp_path):
         """Test that unsupported framework raises error."""
-        gen = ApiGenerator("unsupported")
+        gen = generators["unsupported"]
         routes = [
             ApiRoute(
                 path="/test",
@@ -229,53 +234,30 @@ class TestApiGenerator:
         ]
 
         with pytest.raises(ValueError):
-            gen.generate_code(routes, temp_dir / "test.ts")
+            gen.generate_code(routes, tmp_path / "test.ts")
 
-    def test_generate_api_convenience_function(self, temp_dir):
+    def test_generate_api_convenience_function(self, tmp_path, minimal_spec):
         """Test generate_api convenience function."""
-        spec = Spec(
-            project_name="ConvApp",
-            description="Convenience test",
+        spec = replace(
+            minimal_spec,
             features=[Feature("Users", "User management")],
-            tech_stack=[],
-            database=None,
             auth=AuthConfig(auth_type="jwt"),
-            frontend_framework=None,
-            backend_framework="express",
-            deployment_target=None,
         )
 
-        output_dir = temp_dir / "src" / "api"
-        output_dir.mkdir(parents=True)
-
-        generate_api(spec, output_dir)
+        generate_api(spec, tmp_path)
 
-        assert (output_dir / "routes.ts").exists()
-        assert (output_dir / "openapi.json").exists()
+        assert (tmp_path / "routes.ts").exists()
+        assert (tmp_path / "openapi.json").exists()
 
-    def test_routes_without_auth_marked_correctly(self):
+    def test_routes_without_auth_marked_correctly(self, express_gen, minimal_spec):
         """Test that health check doesn't require auth."""
-        gen = ApiGenerator("express")
-        routes = gen.generate_routes_from_spec(
-            Spec(
-                project_name="App",
-                description="Test",
-                features=[],
-                tech_stack=[],
-                database=None,
-                auth=None,
-                frontend_framework=None,
-                backend_framework="express",
-                deployment_target=None,
-            )
-        )
+        routes = express_gen.generate_routes_from_spec(minimal_spec)
 
-        health = [r for r in routes if r.path == "/health"][0]
+        (health,) = _index_routes(routes)["/health"]
         assert health.authentication_required is False
 
-    def test_express_route_with_authentication(self, temp_dir):
+    def test_express_route_with_authentication(self, express_gen, tmp_path):
         """Test that Express route includes auth middleware."""
-        gen = ApiGenerator("express")
         route = ApiRoute(
             path="/protected",
             method="GET",
@@ -284,12 +266,11 @@ class TestApiGenerator:
             authentication_required=True,
         )
 
-        code = gen._generate_express_route(route)
+        code = express_gen._generate_express_route(route)
         assert "authenticate" in code
 
-    def test_express_route_without_authentication(self, temp_dir):
+    def test_express_route_without_authentication(self, express_gen, tmp_path):
         """Test that Express route without auth doesn't include middleware."""
-        gen = ApiGenerator("express")
         route = ApiRoute(
             path="/public",
             method="GET",
@@ -298,12 +279,12 @@ class TestApiGenerator:
             authentication_required=False,
         )
 
-        code = gen._generate_express_route(route)
+        code = express_gen._generate_express_route(route)
         assert "authenticate" not in code
 
-    def test_fastapi_route_generation(self, temp_dir):
+    def test_fastapi_route_generation(self, generators, tmp_path):
         """Test FastAPI route code generation."""
-        gen = ApiGenerator("fastapi")
+        gen = generators["fastapi"]
         route = ApiRoute(
             path="/items",
             method="GET",
@@ -315,9 +296,9 @@ class TestApiGenerator:
         assert "@router.get" in code
         assert "list_items" in code
 
-    def test_django_view_generation(self, temp_dir):
+    def test_django_view_generation(self, generators, tmp_path):
         """Test Django view code generation."""
-        gen = ApiGenerator("django")
+        gen = generators["django"]
         route = ApiRoute(
             path="/items",
             method="GET",
@@ -329,9 +310,8 @@ class TestApiGenerator:
         assert "def list_items" in code
         assert "@require_http_methods" in code
 
-    def test_schema_includes_request_body(self, temp_dir):
+    def test_schema_includes_request_body(self, express_gen, tmp_path):
         """Test that schema includes request body when specified."""
-        gen = ApiGenerator("express")
         route = ApiRoute(
             path="/users",
             method="POST",
@@ -340,15 +320,14 @@ class TestApiGenerator:
             request_body={"email": "string", "name": "string"},
         )
 
-        schema = gen.generate_schema_json([route], temp_dir / "schema.json")
+        schema = express_gen.generate_schema_json([route], tmp_path / "schema.json")
         schema_data = json.loads(schema)
 
         # Check that request body is in schema
         assert "requestBody" in schema_data["paths"]["/users"]["post"]
 
-    def test_multiple_routes_in_schema(self, temp_dir):
+    def test_multiple_routes_in_schema(self, express_gen, tmp_path):
         """Test schema with multiple routes."""
-        gen = ApiGenerator("express")
         routes = [
             ApiRoute("/users", "GET", "list_users", "List users"),
             ApiRoute("/users", "POST", "create_user", "Create user"),
@@ -356,7 +335,7 @@ class TestApiGenerator:
             ApiRoute("/items", "GET", "list_items", "List items"),
         ]
 
-        schema = gen.generate_schema_json(routes, temp_dir / "schema.json")
+        schema = express_gen.generate_schema_json(routes, tmp_path / "schema.json")
         schema_data = json.loads(schema)
 
         assert "/users" in schema_data["paths"]
@@ -371,7 +350,7 @@ class TestApiGenerator:
 class TestApiGeneratorIntegration:
     """Integration tests for ApiGenerator."""
 
-    def test_full_api_generation_workflow(self, temp_dir):
+    def test_full_api_generation_workflow(self, tmp_path):
         """Test full API generation workflow."""
         spec = Spec(
             project_name="FullAPI",
@@ -391,7 +370,7 @@ class TestApiGeneratorIntegration:
             deployment_target="docker",
         )
 
-        api_dir = temp_dir / "src" / "api"
+        api_dir = tmp_path / "src" / "api"
         api_dir.mkdir(parents=True)
 
         # Generate API
@@ -411,21 +390,17 @@ class TestApiGeneratorIntegration:
         assert schema_data["info"]["title"] == "Generated API"
         assert len(schema_data["paths"]) > 5
 
-    def test_api_generation_for_multiple_frameworks(self, temp_dir):
+    def test_api_generation_for_multiple_frameworks(
+        self, generators, tmp_path, minimal_spec
+    ):
         """Test generating API for different frameworks."""
-        spec = Spec(
-            project_name="MultiFramework",
-            description="Multi-framework test",
+        spec = replace(
+            minimal_spec,
             features=[Feature("Items", "Item management", requires_api=True)],
-            tech_stack=[],
-            database=None,
             auth=AuthConfig(auth_type="jwt"),
-            frontend_framework=None,
-            backend_framework="express",
-            deployment_target=None,
         )
 
         for framework in ["express", "fastapi", "django"]:
-            gen = ApiGenerator(framework)
+            gen = generators[framework]
             routes = gen.generate_routes_from_spec(spec)
             assert len(routes) > 0
@@ -10,7 +10,7 @@ from kodo.orchestrators.api import ApiOrchestrator, _messages_to_text
 from tests.conftest import FakeRunResult
 
 
-def test_cycle_done_returns_finished(tmp_path: Path):
+def test_cycle_done_returns_finished(tmp_path: Path, fake_team):
     log.init(tmp_path, run_id="api_done")
 
     def fake_run_sync(prompt, *, usage_limits=None):
@@ -28,20 +28,18 @@ def test_cycle_done_returns_finished(tmp_path: Path):
         agent_tools = tools or []
         self.run_sync = fake_run_sync
 
-    team = _make_fake_team()
-
     with (
         patch("kodo.orchestrators.api.Agent.__init__", fake_agent_init),
         patch("kodo.orchestrators.api.verify_done", return_value=None),
     ):
         orch = ApiOrchestrator(model="claude-opus-4-6")
-        result = orch.cycle("build feature", tmp_path, team, max_exchanges=10)
+        result = orch.cycle("build feature", tmp_path, fake_team, max_exchanges=10)
 
     assert result.finished is True
     assert result.summary == "all done"
 
 
-def test_cycle_no_done_returns_summary(tmp_path: Path):
+def test_cycle_no_done_returns_summary(tmp_path: Path, fake_team):
     log.init(tmp_path, run_id="api_nodone")
 
     def fake_run_sync(prompt, *, usage_limits=None):
@@ -50,20 +48,18 @@ def test_cycle_no_done_returns_summary(tmp_path: Path):
     def fake_agent_init(self, model, *, system_prompt=None, tools=None, **kwargs):
         self.run_sync = fake_run_sync
 
-    team = _make_fake_team()
-
     with (
         patch("kodo.orchestrators.api.Agent.__init__", fake_agent_init),
         patch.object(ApiOrchestrator, "_summarize", return_value="summary of work"),
     ):
         orch = ApiOrchestrator(model="claude-opus-4-6")
-        result = orch.cycle("build feature", tmp_path, team, max_exchanges=10)
+        result = orch.cycle("build feature", tmp_path, fake_team, max_exchanges=10)
 
     assert result.finished is False
     assert result.summary == "summary of work"
 
 
-def test_usage_limit_exceeded(tmp_path: Path):
+def test_usage_limit_exceeded(tmp_path: Path, fake_team):
     log.init(tmp_path, run_id="api_limit")
     from pydantic_ai.exceptions import UsageLimitExceeded
 
@@ -73,16 +69,14 @@ def test_usage_limit_exceeded(tmp_path: Path):
 
         self.run_sync = fake_run_sync
 
-    team = _make_fake_team()
-
     with patch("kodo.orchestrators.api.Agent.__init__", fake_agent_init):
         orch = ApiOrchestrator(model="claude-opus-4-6")
-        result = orch.cycle("build feature", tmp_path, team, max_exchanges=5)
+        result = orch.cycle("build feature", tmp_path, fake_team, max_exchanges=5)
 
     assert result.finished is False
 
 
-def test_529_fallback(tmp_path: Path):
+def test_529_fallback(tmp_path: Path, fake_team):
     log.init(tmp_path, run_id="api_529")
     from pydantic_ai.exceptions import ModelHTTPError
 
@@ -100,8 +94,6 @@ def test_529_fallback(tmp_path: Path):
 
         self.run_sync = fake_run_sync
 
-    team = _make_fake_team()
-
     with (
         patch("kodo.orchestrators.api.Agent.__init__", fake_agent_init),
         patch.object(ApiOrchestrator, "_summarize", return_value="done"),
@@ -110,7 +102,7 @@ def test_529_fallback(tmp_path: Path):
             model="claude-opus-4-6",
             fallback_model="claude-sonnet-4-5-20250929",
         )
-        result = orch.cycle("build feature", tmp_path, team, max_exchanges=10)
+        result = orch.cycle("build feature", tmp_path, fake_team, max_exchanges=10)
 
     # Should have retried with fallback and succeeded
     assert call_count[0] == 2
@@ -138,16 +130,3 @@ def test_messages_to_text():
     text = _messages_to_text(messages)
     assert "[user] hello" in text
     assert "[assistant] hi there" in text
-
-
-# ── shared helpers ───────────────────────────────────────────────────────
-
-
-def _make_fake_team():
-    """Create a minimal fake TeamConfig for orchestrator tests."""
-    from kodo.agent import Agent
-    from tests.conftest import FakeSession
-
-    session = FakeSession(response_text="ok")
-    agent = Agent(session, "test agent", max_turns=5)
-    return {"worker": agent}
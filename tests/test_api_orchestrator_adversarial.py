@@ -3,7 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import patch
+
+import pytest
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+)
 
 from kodo import log
 from kodo.agent import Agent
@@ -11,97 +19,88 @@ from kodo.orchestrators.api import ApiOrchestrator, _messages_to_text
 from tests.conftest import FakeRunResult, FakeSession
 
 
-def _make_team():
-    session = FakeSession(response_text="ok")
-    return {"worker": Agent(session, "test agent", max_turns=5)}
+@pytest.fixture
+def crash_team():
+    """A team whose worker raises from run()."""
+    crash_agent = Agent(FakeSession(response_text="ok"), "crasher", max_turns=5)
 
+    def crashing_run(*args, **kwargs):
+        raise RuntimeError("agent exploded")
 
-def test_done_with_success_false(tmp_path: Path):
-    """Calling done(success=False) should mark finished but not successful."""
-    log.init(tmp_path, run_id="done_fail")
+    crash_agent.run = crashing_run
+    return {"worker": crash_agent}
+
+
+class _ScriptedAgent:
+    """Stands in for the pydantic-ai Agent: run_sync calls tools from a script.
+
+    *script* is a list of ``(tool_name, kwargs)`` calls, made in order on
+    each run; their return values are collected in ``tool_results``.
+    """
+
+    def __init__(self) -> None:
+        self.tools: list = []
+        self.script: list[tuple[str, dict]] = []
+        self.tool_results: list[str] = []
 
-    def fake_run_sync(prompt, *, usage_limits=None):
-        for tool in agent_tools:
-            if tool.name == "done":
-                tool.function(summary="cannot complete", success=False)
-                break
+    def run_sync(self, prompt, *, usage_limits=None):
+        by_name = {tool.name: tool for tool in self.tools}
+        for name, kwargs in self.script:
+            self.tool_results.append(by_name[name].function(**kwargs))
         return FakeRunResult()
 
-    agent_tools = []
+
+@pytest.fixture
+def scripted_agent(monkeypatch):
+    """Patch ApiOrchestrator's Agent so cycles run a _ScriptedAgent."""
+    scripted = _ScriptedAgent()
 
     def fake_agent_init(self, model, *, system_prompt=None, tools=None, **kwargs):
-        nonlocal agent_tools
-        agent_tools = tools or []
-        self.run_sync = fake_run_sync
+        scripted.tools = tools or []
+        self.run_sync = scripted.run_sync
+
+    monkeypatch.setattr("kodo.orchestrators.api.Agent.__init__", fake_agent_init)
+    return scripted
+
 
-    with patch("kodo.orchestrators.api.Agent.__init__", fake_agent_init):
-        orch = ApiOrchestrator(model="claude-opus-4-6")
-        result = orch.cycle("build feature", tmp_path, _make_team(), max_exchanges=10)
+def test_done_with_success_false(tmp_path: Path, scripted_agent, fake_team):
+    """Calling done(success=False) should mark finished but not successful."""
+    log.init(tmp_path, run_id="done_fail")
+    scripted_agent.script = [("done", {"summary": "cannot complete", "success": False})]
+
+    orch = ApiOrchestrator(model="claude-opus-4-6")
+    result = orch.cycle("build feature", tmp_path, fake_team, max_exchanges=10)
 
     assert result.finished is True
     assert result.success is False
     assert "cannot complete" in result.summary
 
 
-def test_agent_crash_returns_error_string(tmp_path: Path):
+def test_agent_crash_returns_error_string(
+    tmp_path: Path, scripted_agent, crash_team
+):
     """If an agent tool crashes, the orchestrator should get an error string, not crash itself."""
     log.init(tmp_path, run_id="agent_crash")
-    crash_session = FakeSession(response_text="ok")
-    crash_agent = Agent(crash_session, "crasher", max_turns=5)
-
-    # Make the agent's run method raise
-    original_run = crash_agent.run
-
-    def crashing_run(*args, **kwargs):
-        raise RuntimeError("agent exploded")
-
-    crash_agent.run = crashing_run
-
-    team = {"worker": crash_agent}
-    tool_results = []
-
-    def fake_run_sync(prompt, *, usage_limits=None):
-        # Call the worker tool and capture its return
-        for tool in agent_tools:
-            if tool.name == "ask_worker":
-                result = tool.function(task="do something")
-                tool_results.append(result)
-                break
-        # Then call done
-        for tool in agent_tools:
-            if tool.name == "done":
-                tool.function(summary="tried", success=False)
-                break
-        return FakeRunResult()
-
-    agent_tools = []
-
-    def fake_agent_init(self, model, *, system_prompt=None, tools=None, **kwargs):
-        nonlocal agent_tools
-        agent_tools = tools or []
-        self.run_sync = fake_run_sync
+    # Call the worker tool and capture its return, then call done
+    scripted_agent.script = [
+        ("ask_worker", {"task": "do something"}),
+        ("done", {"summary": "tried", "success": False}),
+    ]
 
-    with patch("kodo.orchestrators.api.Agent.__init__", fake_agent_init):
-        orch = ApiOrchestrator(model="claude-opus-4-6")
-        result = orch.cycle("build feature", tmp_path, team, max_exchanges=10)
+    orch = ApiOrchestrator(model="claude-opus-4-6")
+    orch.cycle("build feature", tmp_path, crash_team, max_exchanges=10)
 
     # Should not crash, and the tool result should contain the error
-    assert len(tool_results) == 1
-    assert "ERROR" in tool_results[0]
-    assert "exploded" in tool_results[0]
+    assert len(scripted_agent.tool_results) == 2  # ask_worker, then done
+    worker_result = scripted_agent.tool_results[0]
+    assert "ERROR" in worker_result
+    assert "exploded" in worker_result
 
 
-def test_messages_to_text_with_tool_parts():
-    """_messages_to_text should handle ToolCallPart and ToolReturnPart."""
-    from pydantic_ai.messages import (
-        ModelRequest,
-        ModelResponse,
-        TextPart,
-        ToolCallPart,
-        ToolReturnPart,
-    )
-
-    messages = [
+@pytest.fixture(scope="module")
+def sample_tool_messages():
+    """A text + tool call response followed by the matching tool return."""
+    return [
         ModelResponse(
             parts=[
                 TextPart(part_kind="text", content="Let me call a tool"),
@@ -127,7 +126,11 @@ def test_messages_to_text_with_tool_parts():
             ]
         ),
     ]
-    text = _messages_to_text(messages)
+
+
+def test_messages_to_text_with_tool_parts(sample_tool_messages):
+    """_messages_to_text should handle ToolCallPart and ToolReturnPart."""
+    text = _messages_to_text(sample_tool_messages)
     assert "ask_worker" in text
     assert "done building" in text
     assert "[assistant]" in text
@@ -139,26 +142,14 @@ def test_messages_to_text_empty_list():
     assert _messages_to_text([]) == ""
 
 
-def test_cost_calculation_with_unknown_model(tmp_path: Path):
+def test_cost_calculation_with_unknown_model(
+    tmp_path: Path, scripted_agent, fake_team
+):
     """If the model isn't in the pricing table, cost should be 0 (not crash)."""
     log.init(tmp_path, run_id="unknown_pricing")
+    scripted_agent.script = [("done", {"summary": "done", "success": False})]
 
-    def fake_run_sync(prompt, *, usage_limits=None):
-        for tool in agent_tools:
-            if tool.name == "done":
-                tool.function(summary="done", success=False)
-                break
-        return FakeRunResult()
-
-    agent_tools = []
-
-    def fake_agent_init(self, model, *, system_prompt=None, tools=None, **kwargs):
-        nonlocal agent_tools
-        agent_tools = tools or []
-        self.run_sync = fake_run_sync
-
-    with patch("kodo.orchestrators.api.Agent.__init__", fake_agent_init):
-        orch = ApiOrchestrator(model="some-unknown-model-2026")
-        result = orch.cycle("goal", tmp_path, _make_team(), max_exchanges=5)
+    orch = ApiOrchestrator(model="some-unknown-model-2026")
+    result = orch.cycle("goal", tmp_path, fake_team, max_exchanges=5)
 
     assert result.total_cost_usd == 0.0
@@ -123,6 +123,31 @@ class TestBenchmarkStore:
         store = BenchmarkStore(tmp_path)
         assert store.load_cycle("nonexistent") is None
 
+    def test_save_cycle_overwrites_without_leftovers(self, tmp_path: Path) -> None:
+        store = BenchmarkStore(tmp_path)
+        cb = CycleBenchmark(cycle_id="1", cycle_name="first")
+        store.save_cycle(cb)
+        cb.cycle_name = "second"
+        store.save_cycle(cb)
+
+        assert store.load_cycle("1").cycle_name == "second"
+        assert [p.name for p in store.bench_dir.iterdir()] == ["cycle_1.json"]
+
+    def test_saved_files_are_key_sorted(self, tmp_path: Path) -> None:
+        files = []
+        for i, order in enumerate([("a", "b"), ("b", "a")]):
+            baseline = BenchmarkBaseline(version="v0", timestamp="t")
+            for name in order:
+                baseline.set_metric(name, 1.0, "x")
+            files.append(BenchmarkStore(tmp_path / str(i)).save_baseline(baseline))
+
+        assert files[0].read_bytes() == files[1].read_bytes()
+
+    def test_load_cycle_corrupt(self, tmp_path: Path) -> None:
+        store = BenchmarkStore(tmp_path)
+        (store.bench_dir / "cycle_bad.json").write_text("{not json")
+        assert store.load_cycle("bad") is None
+
     def test_list_cycles(self, tmp_path: Path) -> None:
         store = BenchmarkStore(tmp_path)
         for i in range(3):
@@ -148,6 +173,15 @@ class TestBenchmarkStore:
         assert all_cycles[0].cycle_id == "0"
         assert all_cycles[2].get_metric("metric") == 2.0
 
+    def test_load_all_cycles_many_keeps_order(self, tmp_path: Path) -> None:
+        store = BenchmarkStore(tmp_path)
+        for i in range(6):
+            store.save_cycle(CycleBenchmark(cycle_id=str(i), cycle_name=f"c{i}"))
+        (store.bench_dir / "cycle_3.json").write_text("{not json")
+
+        all_cycles = store.load_all_cycles()
+        assert [cb.cycle_id for cb in all_cycles] == ["0", "1", "2", "4", "5"]
+
 
 # ── Comparison logic ─────────────────────────────────────────────────────
 
@@ -219,6 +253,17 @@ class TestCompareToBaseline:
         comps = compare_to_baseline(baseline, cycle)
         assert len(comps) == 1  # only tokens_per_task
 
+    def test_extra_cycle_metrics_skipped(self) -> None:
+        baseline = BenchmarkBaseline(version="v0")
+        baseline.set_metric("tokens_per_task", 2000, "tokens")
+
+        cycle = CycleBenchmark(cycle_id="1", cycle_name="extra")
+        cycle.add_sample("tokens_per_task", 1500, "tokens")
+        cycle.add_sample("code_quality", 85, "score")  # no baseline for this
+
+        comps = compare_to_baseline(baseline, cycle)
+        assert [c.metric for c in comps] == ["tokens_per_task"]
+
     def test_multiple_metrics(self) -> None:
         baseline = BenchmarkBaseline(version="v0")
         baseline.set_metric("tokens_per_task", 2000, "tokens")
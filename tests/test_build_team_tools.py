@@ -51,3 +51,11 @@ def test_empty_team_only_done() -> None:
     tools = build_team_tools({})
     assert len(tools) == 1
     assert tools[0]["name"] == "done"
+
+
+def test_repeated_calls_reuse_tool_dicts() -> None:
+    team = {"worker": make_agent(prompt="Coder.")}
+    first = build_team_tools(team)
+    second = build_team_tools(team)
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
@@ -0,0 +1,105 @@
+"""Tests for the ask tool in ClaudeCodeOrchestrator's MCP server."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from kodo.orchestrators.base import DoneSignal
+from kodo.orchestrators.claude_code import _build_mcp_server
+from kodo.summarizer import Summarizer
+from tests.conftest import FakeSession, make_agent
+
+
+def _tool_fns(team, project_dir):
+    with (
+        patch("kodo.summarizer._probe_ollama", return_value=None),
+        patch("kodo.summarizer._probe_gemini", return_value=None),
+    ):
+        summarizer = Summarizer()
+        summarizer._backend_ready.wait(timeout=5)
+    mcp = _build_mcp_server(team, project_dir, summarizer, DoneSignal(), "Build X")
+    return {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
+
+
+class _SlowSession(FakeSession):
+    """Session whose query blocks briefly and tracks peak concurrency."""
+
+    active = 0
+    peak = 0
+    _lock = threading.Lock()
+
+    def query(self, prompt, project_dir, *, max_turns):
+        cls = type(self)
+        with cls._lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.1)
+        with cls._lock:
+            cls.active -= 1
+        return super().query(prompt, project_dir, max_turns=max_turns)
+
+
+def _slow_agent():
+    agent = make_agent("ok")
+    agent.session = _SlowSession("ok")
+    return agent
+
+
+def test_ask_handler_returns_report(tmp_project: Path) -> None:
+    fns = _tool_fns({"worker": make_agent("Implemented feature X")}, tmp_project)
+    report = asyncio.run(fns["ask"]("worker", "Implement X"))
+    assert "Implemented feature X" in report
+
+
+def test_delegations_to_different_agents_overlap(tmp_project: Path) -> None:
+    _SlowSession.active = _SlowSession.peak = 0
+    fns = _tool_fns({"a": _slow_agent(), "b": _slow_agent()}, tmp_project)
+
+    async def both():
+        return await asyncio.gather(fns["ask"]("a", "task a"), fns["ask"]("b", "task b"))
+
+    asyncio.run(both())
+    assert _SlowSession.peak == 2
+
+
+def test_delegations_to_same_agent_are_serialized(tmp_project: Path) -> None:
+    _SlowSession.active = _SlowSession.peak = 0
+    fns = _tool_fns({"a": _slow_agent()}, tmp_project)
+
+    async def twice():
+        return await asyncio.gather(fns["ask"]("a", "first"), fns["ask"]("a", "second"))
+
+    asyncio.run(twice())
+    assert _SlowSession.peak == 1
+
+
+def test_single_ask_tool_lists_agents(tmp_project: Path) -> None:
+    team = {"worker": make_agent("ok"), "tester": make_agent("ok")}
+    fns = _tool_fns(team, tmp_project)
+    assert sorted(fns) == ["ask", "done"]
+    assert "- worker: " in fns["ask"].__doc__
+    assert "- tester: " in fns["ask"].__doc__
+
+
+def test_ask_unknown_agent_returns_error(tmp_project: Path) -> None:
+    fns = _tool_fns({"worker": make_agent("ok")}, tmp_project)
+    report = asyncio.run(fns["ask"]("nobody", "Implement X"))
+    assert report.startswith("[ERROR] unknown agent 'nobody'")
+    assert "worker" in report
+
+
+def test_done_verification_waits_for_same_agent_delegation(tmp_project: Path) -> None:
+    _SlowSession.active = _SlowSession.peak = 0
+    fns = _tool_fns({"tester": _slow_agent()}, tmp_project)
+
+    async def overlap():
+        return await asyncio.gather(
+            fns["ask"]("tester", "check the build"), fns["done"]("Built X", True)
+        )
+
+    asyncio.run(overlap())
+    assert _SlowSession.peak == 1
@@ -5,41 +5,56 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
-from types import ModuleType
-from unittest.mock import patch
 
+import pytest
 
 from kodo import log
 from kodo.sessions.claude import ClaudeSession, _extract_tokens
 from tests.mocks.claude_sdk import (
-    MockClaudeAgentOptions,
     MockClaudeSDKClient,
-    MockPermissionResultAllow,
-    MockPermissionResultDeny,
     MockResultMessage,
 )
 
 
-def _install_mock_sdk(responses=None):
-    """Install a fake claude_agent_sdk module and return the mock client that will be created."""
-    mock_client = MockClaudeSDKClient(responses=responses)
+@pytest.fixture
+def make_session(fake_sdk, monkeypatch):
+    """Build ClaudeSessions on a fake SDK; their loops are stopped at teardown.
 
-    fake_mod = ModuleType("claude_agent_sdk")
-    fake_mod.ClaudeAgentOptions = MockClaudeAgentOptions
-    fake_mod.ClaudeSDKClient = lambda options=None: mock_client
-    fake_mod.ResultMessage = MockResultMessage
+    ``make_session(client_factory, **kwargs)`` keeps the fake SDK installed
+    until the test ends, so queries made after construction still see it.
+    Sessions look ``ClaudeSDKClient`` up when they connect, so all sessions
+    in a test use the most recent *client_factory*.
+    """
+    for name, module in fake_sdk.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    sessions: list[ClaudeSession] = []
 
-    fake_types = ModuleType("claude_agent_sdk.types")
-    fake_types.PermissionResultAllow = MockPermissionResultAllow
-    fake_types.PermissionResultDeny = MockPermissionResultDeny
+    def make(client_factory, **kwargs) -> ClaudeSession:
+        monkeypatch.setattr(
+            fake_sdk["claude_agent_sdk"], "ClaudeSDKClient", client_factory
+        )
+        session = ClaudeSession(model="sonnet", **kwargs)
+        sessions.append(session)
+        return session
 
-    return mock_client, {
-        "claude_agent_sdk": fake_mod,
-        "claude_agent_sdk.types": fake_types,
-    }
+    yield make
 
+    for session in sessions:
+        session._loop.call_soon_threadsafe(session._loop.stop)
+        session._thread.join(timeout=5)
 
-def test_query_returns_result(tmp_path: Path):
+
+def _key_recording_client(keys: list):
+    """Client factory noting ANTHROPIC_API_KEY as seen while the client is built."""
+
+    def make_client(options=None):
+        keys.append(os.environ.get("ANTHROPIC_API_KEY"))
+        return MockClaudeSDKClient(options=options)
+
+    return make_client
+
+
+def test_query_returns_result(tmp_path: Path, make_session):
     log.init(tmp_path, run_id="claude_query")
     resp = MockResultMessage(
         result="Hello world",
@@ -47,15 +62,10 @@ def test_query_returns_result(tmp_path: Path):
         total_cost_usd=0.05,
         usage={"input_tokens": 200, "output_tokens": 100},
     )
-    mock_client, fake_modules = _install_mock_sdk(responses=[resp])
+    mock_client = MockClaudeSDKClient(responses=[resp])
 
-    with patch.dict(sys.modules, fake_modules):
-        session = ClaudeSession(model="sonnet", use_api_key=True)
-        try:
-            result = session.query("say hello", tmp_path, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+    session = make_session(lambda options=None: mock_client, use_api_key=True)
+    result = session.query("say hello", tmp_path, max_turns=10)
 
     assert result.text == "Hello world"
     assert result.is_error is False
@@ -65,7 +75,7 @@ def test_query_returns_result(tmp_path: Path):
     assert result.output_tokens == 100
 
 
-def test_stats_accumulate(tmp_path: Path):
+def test_stats_accumulate(tmp_path: Path, make_session):
     log.init(tmp_path, run_id="claude_stats")
     r1 = MockResultMessage(
         result="r1",
@@ -87,31 +97,12 @@ def test_stats_accumulate(tmp_path: Path):
         call_count[0] += 1
         return MockClaudeSDKClient(options=options, responses=responses)
 
-    fake_mod = ModuleType("claude_agent_sdk")
-    fake_mod.ClaudeAgentOptions = MockClaudeAgentOptions
-    fake_mod.ClaudeSDKClient = make_client
-    fake_mod.ResultMessage = MockResultMessage
-    fake_types = ModuleType("claude_agent_sdk.types")
-    fake_types.PermissionResultAllow = MockPermissionResultAllow
-    fake_types.PermissionResultDeny = MockPermissionResultDeny
-
-    with patch.dict(
-        sys.modules,
-        {
-            "claude_agent_sdk": fake_mod,
-            "claude_agent_sdk.types": fake_types,
-        },
-    ):
-        session = ClaudeSession(model="sonnet", use_api_key=True)
-        try:
-            session.query("q1", tmp_path, max_turns=10)
-            # Force reconnect for second query to get fresh client with r2
-            session._client = None
-            session._project_dir = None
-            session.query("q2", tmp_path, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+    session = make_session(make_client, use_api_key=True)
+    session.query("q1", tmp_path, max_turns=10)
+    # Force reconnect for second query to get fresh client with r2
+    session._client = None
+    session._project_dir = None
+    session.query("q2", tmp_path, max_turns=10)
 
     assert session.stats.queries == 2
     assert session.stats.total_input_tokens == 300
@@ -119,21 +110,33 @@ def test_stats_accumulate(tmp_path: Path):
     assert abs(session.stats.total_cost_usd - 0.03) < 1e-9
 
 
-def test_reset_disconnects(tmp_path: Path):
+def test_reset_disconnects(tmp_path: Path, make_session):
     log.init(tmp_path, run_id="claude_reset")
-    mock_client, fake_modules = _install_mock_sdk()
+    mock_client = MockClaudeSDKClient()
+
+    session = make_session(lambda options=None: mock_client, use_api_key=True)
+    session.query("q", tmp_path, max_turns=10)
+    assert session.stats.queries == 1
+    session.reset()
+    assert session.stats.queries == 0
+    assert session._client is None
+
 
-    with patch.dict(sys.modules, fake_modules):
-        session = ClaudeSession(model="sonnet", use_api_key=True)
-        try:
-            session.query("q", tmp_path, max_turns=10)
-            assert session.stats.queries == 1
-            session.reset()
-            assert session.stats.queries == 0
-            assert session._client is None
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+def test_public_session_is_the_threaded_implementation():
+    """kodo.sessions must export the full ClaudeSession, not a slimmed copy."""
+    from kodo.sessions import ClaudeSession as exported
+
+    assert exported is ClaudeSession
+    session = ClaudeSession(
+        model="sonnet", system_prompt="Be terse.", chrome=True, fallback_model="haiku"
+    )
+    try:
+        assert session.chrome is True
+        assert session.system_prompt == "Be terse."
+        assert session._thread.is_alive()
+        assert callable(session._can_use_tool)
+    finally:
+        session.close()
 
 
 def test_extract_tokens_variants():
@@ -141,42 +144,22 @@ def test_extract_tokens_variants():
     assert _extract_tokens({"prompt_tokens": 10, "completion_tokens": 5}) == (10, 5)
     assert _extract_tokens(None) == (None, None)
     assert _extract_tokens({}) == (None, None)
+    # An explicit zero must not fall through to the alternate key
+    assert _extract_tokens(
+        {"input_tokens": 0, "prompt_tokens": 7, "output_tokens": 3}
+    ) == (0, 3)
 
 
-def test_api_key_stripped_by_default(tmp_path: Path, monkeypatch):
+def test_api_key_stripped_by_default(tmp_path: Path, monkeypatch, make_session):
     log.init(tmp_path, run_id="claude_key_strip")
 
     keys_during_init = []
-
-    class TrackingOptions(MockClaudeAgentOptions):
-        def __init__(self, **kwargs):
-            super().__init__(**kwargs)
-            keys_during_init.append(os.environ.get("ANTHROPIC_API_KEY"))
-
-    mock_client = MockClaudeSDKClient()
-    fake_mod = ModuleType("claude_agent_sdk")
-    fake_mod.ClaudeAgentOptions = TrackingOptions
-    fake_mod.ClaudeSDKClient = lambda options=None: mock_client
-    fake_mod.ResultMessage = MockResultMessage
-    fake_types = ModuleType("claude_agent_sdk.types")
-    fake_types.PermissionResultAllow = MockPermissionResultAllow
-    fake_types.PermissionResultDeny = MockPermissionResultDeny
-
     monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-secret")
 
-    with patch.dict(
-        sys.modules,
-        {
-            "claude_agent_sdk": fake_mod,
-            "claude_agent_sdk.types": fake_types,
-        },
-    ):
-        session = ClaudeSession(model="sonnet", use_api_key=False)
-        try:
-            session.query("q", tmp_path, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+    session = make_session(
+        _key_recording_client(keys_during_init), use_api_key=False
+    )
+    session.query("q", tmp_path, max_turns=10)
 
     # Key should have been stripped during _ensure_client
     assert keys_during_init[0] is None
@@ -184,39 +167,15 @@ def test_api_key_stripped_by_default(tmp_path: Path, monkeypatch):
     assert os.environ.get("ANTHROPIC_API_KEY") == "sk-test-secret"
 
 
-def test_api_key_kept_when_explicit(tmp_path: Path, monkeypatch):
+def test_api_key_kept_when_explicit(tmp_path: Path, monkeypatch, make_session):
     log.init(tmp_path, run_id="claude_key_keep")
 
     keys_during_init = []
-
-    class TrackingOptions(MockClaudeAgentOptions):
-        def __init__(self, **kwargs):
-            super().__init__(**kwargs)
-            keys_during_init.append(os.environ.get("ANTHROPIC_API_KEY"))
-
-    mock_client = MockClaudeSDKClient()
-    fake_mod = ModuleType("claude_agent_sdk")
-    fake_mod.ClaudeAgentOptions = TrackingOptions
-    fake_mod.ClaudeSDKClient = lambda options=None: mock_client
-    fake_mod.ResultMessage = MockResultMessage
-    fake_types = ModuleType("claude_agent_sdk.types")
-    fake_types.PermissionResultAllow = MockPermissionResultAllow
-    fake_types.PermissionResultDeny = MockPermissionResultDeny
-
     monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-secret")
 
-    with patch.dict(
-        sys.modules,
-        {
-            "claude_agent_sdk": fake_mod,
-            "claude_agent_sdk.types": fake_types,
-        },
-    ):
-        session = ClaudeSession(model="sonnet", use_api_key=True)
-        try:
-            session.query("q", tmp_path, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+    session = make_session(
+        _key_recording_client(keys_during_init), use_api_key=True
+    )
+    session.query("q", tmp_path, max_turns=10)
 
     assert keys_during_init[0] == "sk-test-secret"
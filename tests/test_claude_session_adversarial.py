@@ -4,131 +4,137 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from types import ModuleType
-from unittest.mock import patch
+
+import pytest
 
 from kodo import log
+from kodo.sessions.base import SessionStats
 from kodo.sessions.claude import ClaudeSession
-from tests.mocks.claude_sdk import (
-    MockClaudeAgentOptions,
-    MockClaudeSDKClient,
-    MockPermissionResultAllow,
-    MockPermissionResultDeny,
-    MockResultMessage,
-)
-
-
-def _fake_modules(responses=None, client_factory=None):
-    """Build fake claude_agent_sdk modules. Returns (client_or_factory, modules_dict)."""
-    if client_factory is None:
-        mock_client = MockClaudeSDKClient(responses=responses)
-        client_factory_fn = lambda options=None: mock_client
-    else:
-        mock_client = None
-        client_factory_fn = client_factory
-
-    fake_mod = ModuleType("claude_agent_sdk")
-    fake_mod.ClaudeAgentOptions = MockClaudeAgentOptions
-    fake_mod.ClaudeSDKClient = client_factory_fn
-    fake_mod.ResultMessage = MockResultMessage
+from tests.mocks.claude_sdk import MockClaudeSDKClient, MockResultMessage
 
-    fake_types = ModuleType("claude_agent_sdk.types")
-    fake_types.PermissionResultAllow = MockPermissionResultAllow
-    fake_types.PermissionResultDeny = MockPermissionResultDeny
 
-    return mock_client, {
-        "claude_agent_sdk": fake_mod,
-        "claude_agent_sdk.types": fake_types,
-    }
+@pytest.fixture(scope="module")
+def claude_session(fake_sdk):
+    """One session (and loop thread) for the module, on the fake SDK.
 
+    Tests get it through ``session``, which resets it first; the client each
+    test sees is set with ``use_client``.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name, module in fake_sdk.items():
+            mp.setitem(sys.modules, name, module)
+        session = ClaudeSession(use_api_key=True)
+        yield session
+        session.close()
 
-def _run_session(
-    tmp_path, run_id, responses=None, client_factory=None, **session_kwargs
-):
-    """Helper: create session, run one query, clean up. Returns (session, result)."""
-    log.init(tmp_path, run_id=run_id)
-    session_kwargs.setdefault("use_api_key", True)
-    _, modules = _fake_modules(responses=responses, client_factory=client_factory)
-
-    with patch.dict(sys.modules, modules):
-        session = ClaudeSession(**session_kwargs)
-        try:
-            result = session.query("test prompt", tmp_path, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
-
-    return session, result
-
-
-def test_none_cost_treated_as_zero(tmp_path: Path):
-    """If total_cost_usd is None, stats should accumulate 0, not crash."""
-    resp = MockResultMessage(
-        result="ok", total_cost_usd=None, usage={"input_tokens": 10, "output_tokens": 5}
-    )
-    session, result = _run_session(tmp_path, "none_cost", responses=[resp])
-
-    assert session.stats.total_cost_usd == 0.0
-    assert result.cost_usd is None
 
+@pytest.fixture
+def session(claude_session):
+    """The module's session with the previous test's state cleared."""
+    claude_session._disconnect()
+    claude_session._project_dir = None
+    claude_session._session_id = None
+    claude_session._stats = SessionStats()
+    claude_session._pending_plan = None
+    claude_session._plan_reviewed = False
+    return claude_session
 
-def test_none_usage_tokens_treated_as_zero(tmp_path: Path):
-    """If usage is None, token stats should stay at 0."""
-    resp = MockResultMessage(result="ok", total_cost_usd=0.0, usage=None)
-    session, result = _run_session(tmp_path, "none_usage", responses=[resp])
 
-    assert session.stats.total_input_tokens == 0
-    assert session.stats.total_output_tokens == 0
-    assert result.input_tokens is None
-    assert result.output_tokens is None
+@pytest.fixture
+def use_client(fake_sdk, monkeypatch):
+    """Set the fake SDK's ClaudeSDKClient for this test."""
 
+    def use(client_factory) -> None:
+        monkeypatch.setattr(
+            fake_sdk["claude_agent_sdk"], "ClaudeSDKClient", client_factory
+        )
 
-def test_empty_result_string(tmp_path: Path):
-    """ResultMessage with empty result string should not crash."""
-    resp = MockResultMessage(result="", is_error=False)
-    session, result = _run_session(tmp_path, "empty_result", responses=[resp])
-    assert result.text == ""
-    assert result.is_error is False
+    return use
 
 
-def test_error_result_propagated(tmp_path: Path):
-    """If is_error=True, the QueryResult should reflect that."""
-    resp = MockResultMessage(result="something went wrong", is_error=True)
-    session, result = _run_session(tmp_path, "error_result", responses=[resp])
-    assert result.is_error is True
-    assert "something went wrong" in result.text
+@pytest.fixture
+def run_query(shared_project, session, use_client):
+    """``run_query(run_id, responses)``: one query on ``session``; returns the result."""
 
+    def run(run_id, responses=None):
+        log.init(shared_project, run_id=run_id)
+        mock_client = MockClaudeSDKClient(responses=responses)
+        use_client(lambda options=None: mock_client)
+        return session.query("test prompt", shared_project, max_turns=10)
+
+    return run
+
+
+@pytest.mark.parametrize(
+    "responses,expected,stats",
+    [
+        # A None cost is reported as None but accumulates as 0
+        pytest.param(
+            [
+                MockResultMessage(
+                    result="ok",
+                    total_cost_usd=None,
+                    usage={"input_tokens": 10, "output_tokens": 5},
+                )
+            ],
+            {"cost_usd": None},
+            {"total_cost_usd": 0.0},
+            id="none_cost",
+        ),
+        # No usage: token counts are None and stats stay at 0
+        pytest.param(
+            [MockResultMessage(result="ok", total_cost_usd=0.0, usage=None)],
+            {"input_tokens": None, "output_tokens": None},
+            {"total_input_tokens": 0, "total_output_tokens": 0},
+            id="none_usage",
+        ),
+        pytest.param(
+            [MockResultMessage(result="", is_error=False)],
+            {"text": "", "is_error": False},
+            {},
+            id="empty_result",
+        ),
+        pytest.param(
+            [MockResultMessage(result="something went wrong", is_error=True)],
+            {"text": "something went wrong", "is_error": True},
+            {},
+            id="error_result",
+        ),
+        # receive_response yields nothing: the default empty QueryResult
+        pytest.param([], {"text": ""}, {}, id="no_messages"),
+    ],
+)
+def test_result_message_handling(
+    request, session, run_query, responses, expected, stats
+):
+    """Odd ResultMessage fields come through to the QueryResult and stats."""
+    result = run_query(request.node.callspec.id, responses=responses)
 
-def test_no_messages_from_receive_response(tmp_path: Path):
-    """If receive_response yields nothing, result should be the default empty QueryResult."""
-    session, result = _run_session(tmp_path, "no_messages", responses=[])
-    assert result.text == ""
+    for attr, value in expected.items():
+        assert getattr(result, attr) == value, attr
+    for attr, value in stats.items():
+        assert getattr(session.stats, attr) == value, attr
 
 
-def test_same_project_dir_reuses_client(tmp_path: Path):
+def test_same_project_dir_reuses_client(shared_project: Path, session, use_client):
     """Querying the same project_dir twice should not create a second client."""
-    log.init(tmp_path, run_id="reuse_client")
+    log.init(shared_project, run_id="reuse_client")
     client_count = [0]
 
     def counting_factory(options=None):
         client_count[0] += 1
         return MockClaudeSDKClient(options=options)
 
-    _, modules = _fake_modules(client_factory=counting_factory)
-
-    with patch.dict(sys.modules, modules):
-        session = ClaudeSession(use_api_key=True)
-        try:
-            session.query("q1", tmp_path, max_turns=10)
-            session.query("q2", tmp_path, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+    use_client(counting_factory)
+    session.query("q1", shared_project, max_turns=10)
+    session.query("q2", shared_project, max_turns=10)
 
     assert client_count[0] == 1  # Only one client created
 
 
-def test_different_project_dir_creates_new_client(tmp_path: Path):
+def test_different_project_dir_creates_new_client(
+    tmp_path: Path, session, use_client
+):
     """Querying a different project_dir should create a new client."""
     log.init(tmp_path, run_id="diff_dir")
     client_count = [0]
@@ -141,39 +147,22 @@ def test_different_project_dir_creates_new_client(tmp_path: Path):
         client_count[0] += 1
         return MockClaudeSDKClient(options=options)
 
-    _, modules = _fake_modules(client_factory=counting_factory)
-
-    with patch.dict(sys.modules, modules):
-        session = ClaudeSession(use_api_key=True)
-        try:
-            session.query("q1", dir_a, max_turns=10)
-            session.query("q2", dir_b, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+    use_client(counting_factory)
+    session.query("q1", dir_a, max_turns=10)
+    session.query("q2", dir_b, max_turns=10)
 
     assert client_count[0] == 2
 
 
-def test_plan_mode_captured_in_result(tmp_path: Path):
+def test_plan_mode_captured_in_result(session, run_query):
     """When _can_use_tool denies ExitPlanMode, the plan should appear in the result text."""
-    log.init(tmp_path, run_id="plan_mode")
-    resp = MockResultMessage(result="waiting for review", is_error=False)
-    _, modules = _fake_modules(responses=[resp])
+    # Simulate what happens when ExitPlanMode is denied:
+    # the session captures the plan
+    session._pending_plan = "Step 1: do X\nStep 2: do Y"
 
-    with patch.dict(sys.modules, modules):
-        session = ClaudeSession(use_api_key=True)
-        try:
-            # Simulate what happens when ExitPlanMode is denied:
-            # the session captures the plan
-            session._pending_plan = "Step 1: do X\nStep 2: do Y"
-
-            # Trigger a query — it should prepend the plan
-            # But first we need _ensure_client to work, so set up the client
-            session.query("review my plan", tmp_path, max_turns=10)
-        finally:
-            session._loop.call_soon_threadsafe(session._loop.stop)
-            session._thread.join(timeout=5)
+    # Trigger a query — it should prepend the plan
+    resp = MockResultMessage(result="waiting for review", is_error=False)
+    run_query("plan_mode", responses=[resp])
 
     # The pending plan was set before query, so _plan_reviewed should have been set True
     # and _pending_plan cleared. The plan text won't appear in result because the
@@ -182,18 +171,19 @@ def test_plan_mode_captured_in_result(tmp_path: Path):
     assert session._plan_reviewed is True
 
 
-def test_query_after_close_raises(tmp_path: Path):
+def test_query_after_close_raises(shared_project: Path, fake_sdk, monkeypatch):
     """After close(), attempting to query should fail (loop is stopped)."""
-    log.init(tmp_path, run_id="after_close")
-    _, modules = _fake_modules()
-
-    with patch.dict(sys.modules, modules):
-        session = ClaudeSession(use_api_key=True)
-        session.close()
-
-        # The event loop is now stopped — submitting a coroutine should fail
-        try:
-            session.query("q", tmp_path, max_turns=10)
-            assert False, "Expected an exception after close()"
-        except Exception:
-            pass  # Any exception is acceptable — the point is it shouldn't silently succeed
+    log.init(shared_project, run_id="after_close")
+    # Its own session: closing the shared one would break the rest of the module
+    for name, module in fake_sdk.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+    session = ClaudeSession(use_api_key=True)
+    session.close()
+
+    # The event loop is now stopped — submitting a coroutine should fail
+    try:
+        session.query("q", shared_project, max_turns=10)
+        assert False, "Expected an exception after close()"
+    except Exception:
+        pass  # Any exception is acceptable — the point is it shouldn't silently succeed
@@ -23,25 +23,28 @@ def temp_dir():
 
 @pytest.fixture
 def basic_config():
-    """Create a basic configuration manager."""
+    """Create a basic configuration manager, fresh for tests that add configs."""
+    return ConfigurationManager("TestApp")
+
+
+@pytest.fixture(scope="module")
+def shared_config():
+    """One unmodified manager for tests that only read or render it."""
     return ConfigurationManager("TestApp")
 
 
 class TestConfigurationManager:
     """Test suite for ConfigurationManager."""
 
-    def test_initialization(self):
+    def test_initialization(self, shared_config):
         """Test ConfigurationManager initialization."""
-        config = ConfigurationManager("MyApp")
-        assert config.project_name == "MyApp"
-        assert len(config.configs) > 0
+        assert shared_config.project_name == "TestApp"
+        assert len(shared_config.configs) > 0
 
-    def test_default_sections(self):
+    def test_default_sections(self, shared_config):
         """Test that default sections are created."""
-        config = ConfigurationManager("App")
-        
         expected_sections = {"app", "database", "auth", "server", "features"}
-        assert set(config.configs.keys()) == expected_sections
+        assert set(shared_config.configs.keys()) == expected_sections
 
     def test_add_config_value(self, basic_config):
         """Test adding a configuration value."""
@@ -90,9 +93,9 @@ class TestConfigurationManager:
         assert "APP_ENV" in env_content
         assert "postgresql://localhost/db" in env_content
 
-    def test_env_file_written_to_disk(self, temp_dir, basic_config):
+    def test_env_file_written_to_disk(self, temp_dir, shared_config):
         """Test that .env file is written to disk."""
-        basic_config.generate_env_file(temp_dir / ".env")
+        shared_config.generate_env_file(temp_dir / ".env")
         
         assert (temp_dir / ".env").exists()
         content = (temp_dir / ".env").read_text()
@@ -131,23 +134,23 @@ class TestConfigurationManager:
         assert "app" in data
         assert "port" in data["app"]
 
-    def test_config_json_file_written(self, temp_dir, basic_config):
+    def test_config_json_file_written(self, temp_dir, shared_config):
         """Test that config.json is written to disk."""
-        basic_config.generate_config_json(temp_dir / "config.json")
+        shared_config.generate_config_json(temp_dir / "config.json")
         
         assert (temp_dir / "config.json").exists()
 
-    def test_generate_config_ts(self, temp_dir, basic_config):
+    def test_generate_config_ts(self, temp_dir, shared_config):
         """Test TypeScript config generation."""
-        ts_code = basic_config.generate_config_ts(temp_dir / "config.ts")
+        ts_code = shared_config.generate_config_ts(temp_dir / "config.ts")
         
         assert "import dotenv" in ts_code
         assert "interface Config" in ts_code
         assert "export default" in ts_code
 
-    def test_generate_config_py(self, temp_dir, basic_config):
+    def test_generate_config_py(self, temp_dir, shared_config):
         """Test Python config generation."""
-        py_code = basic_config.generate_config_py(temp_dir / "config.py")
+        py_code = shared_config.generate_config_py(temp_dir / "config.py")
         
         assert "class Config:" in py_code
         assert "os.getenv" in py_code
@@ -19,30 +19,30 @@ def _make_popen_factory(**defaults):
     return factory
 
 
-def test_query_returns_result(tmp_path: Path):
-    log.init(tmp_path, run_id="cursor_test")
+def test_query_returns_result(shared_project: Path):
+    log.init(shared_project, run_id="cursor_test")
     session = CursorSession(model="composer-1.5")
 
     with patch(
         "kodo.sessions.cursor.subprocess.Popen",
         _make_popen_factory(result_text="All done!", chat_id="c1"),
     ):
-        result = session.query("do stuff", tmp_path, max_turns=10)
+        result = session.query("do stuff", shared_project, max_turns=10)
 
     assert result.text == "All done!"
     assert result.is_error is False
     assert session.stats.queries == 1
 
 
-def test_chat_id_captured_for_resume(tmp_path: Path):
-    log.init(tmp_path, run_id="cursor_resume")
+def test_chat_id_captured_for_resume(shared_project: Path):
+    log.init(shared_project, run_id="cursor_resume")
     session = CursorSession(model="composer-1.5")
 
     with patch(
         "kodo.sessions.cursor.subprocess.Popen",
         _make_popen_factory(result_text="ok", chat_id="chat-xyz"),
     ):
-        session.query("first", tmp_path, max_turns=10)
+        session.query("first", shared_project, max_turns=10)
 
     # Second query should include --resume
     calls = []
@@ -53,14 +53,14 @@ def test_chat_id_captured_for_resume(tmp_path: Path):
         return original_factory(cmd, **kwargs)
 
     with patch("kodo.sessions.cursor.subprocess.Popen", capturing_factory):
-        session.query("second", tmp_path, max_turns=10)
+        session.query("second", shared_project, max_turns=10)
 
     assert "--resume" in calls[0]
     assert "chat-xyz" in calls[0]
 
 
-def test_system_prompt_prepended_once(tmp_path: Path):
-    log.init(tmp_path, run_id="cursor_sysprompt")
+def test_system_prompt_prepended_once(shared_project: Path):
+    log.init(shared_project, run_id="cursor_sysprompt")
     session = CursorSession(model="composer-1.5", system_prompt="Be helpful.")
 
     calls = []
@@ -70,8 +70,8 @@ def test_system_prompt_prepended_once(tmp_path: Path):
         return MockCursorProcess(cmd, result_text="ok", chat_id="c1", **kwargs)
 
     with patch("kodo.sessions.cursor.subprocess.Popen", capturing_factory):
-        session.query("task1", tmp_path, max_turns=10)
-        session.query("task2", tmp_path, max_turns=10)
+        session.query("task1", shared_project, max_turns=10)
+        session.query("task2", shared_project, max_turns=10)
 
     # First command should have system prompt prepended
     assert "Be helpful." in calls[0][-1]
@@ -79,8 +79,8 @@ def test_system_prompt_prepended_once(tmp_path: Path):
     assert "Be helpful." not in calls[1][-1]
 
 
-def test_error_on_nonzero_returncode(tmp_path: Path):
-    log.init(tmp_path, run_id="cursor_error")
+def test_error_on_nonzero_returncode(shared_project: Path):
+    log.init(shared_project, run_id="cursor_error")
     session = CursorSession(model="composer-1.5")
 
     with patch(
@@ -89,20 +89,20 @@ def test_error_on_nonzero_returncode(tmp_path: Path):
             result_text="", chat_id="c1", returncode=1, stderr_text="fatal error\n"
         ),
     ):
-        result = session.query("fail", tmp_path, max_turns=10)
+        result = session.query("fail", shared_project, max_turns=10)
 
     assert result.is_error is True
 
 
-def test_reset_clears_state(tmp_path: Path):
-    log.init(tmp_path, run_id="cursor_reset")
+def test_reset_clears_state(shared_project: Path):
+    log.init(shared_project, run_id="cursor_reset")
     session = CursorSession(model="composer-1.5")
 
     with patch(
         "kodo.sessions.cursor.subprocess.Popen",
         _make_popen_factory(result_text="ok", chat_id="c1"),
     ):
-        session.query("task", tmp_path, max_turns=10)
+        session.query("task", shared_project, max_turns=10)
 
     assert session.stats.queries == 1
     assert session._chat_id == "c1"
@@ -112,3 +112,54 @@ def test_reset_clears_state(tmp_path: Path):
     assert session.stats.queries == 0
     assert session._chat_id is None
     assert session._system_prompt_sent is False
+
+
+def test_executable_resolved_once(shared_project: Path):
+    from kodo.sessions import cursor as cursor_mod
+
+    log.init(shared_project, run_id="cursor_which")
+    cursor_mod._cursor_agent_executable.cache_clear()
+    calls = []
+
+    def capturing_factory(cmd, **kwargs):
+        calls.append(cmd)
+        return MockCursorProcess(cmd, result_text="ok", chat_id="c1", **kwargs)
+
+    try:
+        with (
+            patch(
+                "kodo.sessions.cursor.shutil.which",
+                return_value="/opt/bin/cursor-agent",
+            ) as which,
+            patch("kodo.sessions.cursor.subprocess.Popen", capturing_factory),
+        ):
+            session = CursorSession()
+            session.query("one", shared_project, max_turns=10)
+            session.query("two", shared_project, max_turns=10)
+    finally:
+        cursor_mod._cursor_agent_executable.cache_clear()
+
+    assert which.call_count == 1
+    assert [c[0] for c in calls] == ["/opt/bin/cursor-agent"] * 2
+
+
+def test_all_stream_events_logged(shared_project: Path):
+    import json
+
+    log_file = log.init(shared_project, run_id="cursor_raw")
+    session = CursorSession(model="composer-1.5")
+    events = [
+        {"type": "system", "subtype": "init", "model": "composer-1.5"},
+        {"type": "tool_call", "subtype": "started", "tool": "readFile"},
+    ]
+
+    with patch(
+        "kodo.sessions.cursor.subprocess.Popen",
+        _make_popen_factory(result_text="ok", chat_id="c1", extra_messages=events),
+    ):
+        session.query("task", shared_project, max_turns=10)
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    (end,) = [r for r in records if r["event"] == "session_query_end"]
+    assert end["raw_messages"][:2] == events
+    assert end["raw_messages"][2]["type"] == "result"
@@ -11,75 +11,65 @@ from kodo.sessions.cursor import CursorSession
 from tests.mocks.cursor_process import MockCursorProcess
 
 
-def test_no_result_message_returns_empty_text(tmp_path: Path):
+def test_no_result_message_returns_empty_text(shared_project: Path):
     """If cursor-agent produces output but no 'result' type message, text should be empty."""
-    log.init(tmp_path, run_id="no_result")
+    log.init(shared_project, run_id="no_result")
     session = CursorSession()
 
     def factory(cmd, **kwargs):
-        proc = MockCursorProcess(cmd, result_text="", chat_id="c1", **kwargs)
-        # Replace stdout with only non-result messages
-        import io
-
+        # Only non-result messages
         messages = [
-            json.dumps({"type": "progress", "message": "working..."}),
-            json.dumps({"type": "status", "chatId": "c1"}),
+            {"type": "progress", "message": "working..."},
+            {"type": "status", "chatId": "c1"},
         ]
-        proc.stdout = io.StringIO("\n".join(messages) + "\n")
-        return proc
+        return MockCursorProcess(
+            cmd, extra_messages=messages, include_result=False, **kwargs
+        )
 
     with patch("kodo.sessions.cursor.subprocess.Popen", factory):
-        result = session.query("do something", tmp_path, max_turns=10)
+        result = session.query("do something", shared_project, max_turns=10)
 
     assert result.text == ""
     assert result.is_error is False
 
 
-def test_empty_stdout_no_crash(tmp_path: Path):
+def test_empty_stdout_no_crash(shared_project: Path):
     """If cursor-agent produces no output at all, should return empty result."""
-    log.init(tmp_path, run_id="empty_out")
+    log.init(shared_project, run_id="empty_out")
     session = CursorSession()
 
     def factory(cmd, **kwargs):
-        import io
-
-        proc = MockCursorProcess(cmd, result_text="", chat_id="c1", **kwargs)
-        proc.stdout = io.StringIO("")
-        return proc
+        return MockCursorProcess(cmd, include_result=False, **kwargs)
 
     with patch("kodo.sessions.cursor.subprocess.Popen", factory):
-        result = session.query("do something", tmp_path, max_turns=10)
+        result = session.query("do something", shared_project, max_turns=10)
 
     assert result.text == ""
     assert result.is_error is False
 
 
-def test_chat_id_from_alternate_keys(tmp_path: Path):
+def test_chat_id_from_alternate_keys(shared_project: Path):
     """cursor-agent might report chat_id or session_id instead of chatId."""
-    log.init(tmp_path, run_id="alt_keys")
+    log.init(shared_project, run_id="alt_keys")
 
     for key in ["chat_id", "session_id"]:
         session = CursorSession()
 
         def factory(cmd, key=key, **kwargs):
-            import io
-
-            messages = [
-                json.dumps({"type": "result", "result": "ok", key: f"id-{key}"}),
-            ]
-            proc = MockCursorProcess(cmd, result_text="ok", chat_id="c1", **kwargs)
-            proc.stdout = io.StringIO("\n".join(messages) + "\n")
-            return proc
+            messages = [{"type": "result", "result": "ok", key: f"id-{key}"}]
+            return MockCursorProcess(
+                cmd, extra_messages=messages, include_result=False, **kwargs
+            )
 
         with patch("kodo.sessions.cursor.subprocess.Popen", factory):
-            session.query("q", tmp_path, max_turns=10)
+            session.query("q", shared_project, max_turns=10)
 
         assert session._chat_id == f"id-{key}"
 
 
-def test_system_prompt_resent_after_reset(tmp_path: Path):
+def test_system_prompt_resent_after_reset(shared_project: Path):
     """After reset(), the system prompt should be prepended to the next query again."""
-    log.init(tmp_path, run_id="reset_sysprompt")
+    log.init(shared_project, run_id="reset_sysprompt")
     session = CursorSession(system_prompt="Be careful.")
 
     calls = []
@@ -89,18 +79,18 @@ def test_system_prompt_resent_after_reset(tmp_path: Path):
         return MockCursorProcess(cmd, result_text="ok", chat_id="c1", **kwargs)
 
     with patch("kodo.sessions.cursor.subprocess.Popen", factory):
-        session.query("first", tmp_path, max_turns=10)
+        session.query("first", shared_project, max_turns=10)
         session.reset()
-        session.query("second", tmp_path, max_turns=10)
+        session.query("second", shared_project, max_turns=10)
 
     # Both first and post-reset queries should have system prompt
     assert "Be careful." in calls[0][-1]
     assert "Be careful." in calls[1][-1]
 
 
-def test_large_result_text_not_truncated(tmp_path: Path):
+def test_large_result_text_not_truncated(shared_project: Path):
     """Session should pass through large result text without truncating."""
-    log.init(tmp_path, run_id="large_result")
+    log.init(shared_project, run_id="large_result")
     session = CursorSession()
     big_text = "x" * 100_000
 
@@ -108,14 +98,14 @@ def test_large_result_text_not_truncated(tmp_path: Path):
         return MockCursorProcess(cmd, result_text=big_text, chat_id="c1", **kwargs)
 
     with patch("kodo.sessions.cursor.subprocess.Popen", factory):
-        result = session.query("q", tmp_path, max_turns=10)
+        result = session.query("q", shared_project, max_turns=10)
 
     assert len(result.text) == 100_000
 
 
-def test_workspace_flag_matches_project_dir(tmp_path: Path):
+def test_workspace_flag_matches_project_dir(shared_project: Path):
     """The --workspace flag should be set to the project_dir."""
-    log.init(tmp_path, run_id="workspace")
+    log.init(shared_project, run_id="workspace")
     session = CursorSession()
     calls = []
 
@@ -124,8 +114,31 @@ def test_workspace_flag_matches_project_dir(tmp_path: Path):
         return MockCursorProcess(cmd, result_text="ok", chat_id="c1", **kwargs)
 
     with patch("kodo.sessions.cursor.subprocess.Popen", factory):
-        session.query("q", tmp_path, max_turns=10)
+        session.query("q", shared_project, max_turns=10)
 
     cmd = calls[0]
     ws_idx = cmd.index("--workspace")
-    assert cmd[ws_idx + 1] == str(tmp_path)
+    assert cmd[ws_idx + 1] == str(shared_project)
+
+
+def test_non_json_and_non_object_lines_skipped(shared_project: Path):
+    """Stray log lines, bare JSON scalars and non-UTF-8 output must not crash parsing."""
+    log.init(shared_project, run_id="stray_lines")
+    session = CursorSession()
+
+    def factory(cmd, **kwargs):
+        import io
+
+        proc = MockCursorProcess(cmd, result_text="ok", chat_id="c1", **kwargs)
+        proc.stdout = io.BytesIO(
+            b"warming up...\n42\n\xff\xfe garbage\n{not json\n"
+            + json.dumps({"type": "result", "result": "café", "chatId": "c9"}).encode()
+            + b"\n"
+        )
+        return proc
+
+    with patch("kodo.sessions.cursor.subprocess.Popen", factory):
+        result = session.query("q", shared_project, max_turns=10)
+
+    assert result.text == "café"
+    assert session._chat_id == "c9"
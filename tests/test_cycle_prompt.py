@@ -0,0 +1,37 @@
+"""Tests for build_cycle_prompt."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from kodo.orchestrators.base import build_cycle_prompt
+
+
+def test_first_cycle_has_goal_and_project_dir() -> None:
+    prompt = build_cycle_prompt("Build X", Path("/work/x"))
+    assert prompt.startswith("# Goal\n\nBuild X")
+    assert "Project directory: /work/x" in prompt
+    assert "Previous progress" not in prompt
+
+
+def test_later_cycles_extend_the_first_cycle_prompt() -> None:
+    """Prior progress is appended only, so every cycle shares a cacheable prefix."""
+    first = build_cycle_prompt("Build X", Path("/work/x"))
+    second = build_cycle_prompt("Build X", Path("/work/x"), "Added models.")
+    third = build_cycle_prompt("Build X", Path("/work/x"), "Added models and views.")
+
+    assert second.startswith(first)
+    assert third.startswith(first)
+    assert second.endswith("Added models.\n\nContinue working toward the goal.")
+
+
+def test_long_prior_summary_keeps_most_recent_progress() -> None:
+    from kodo.orchestrators.base import _PRIOR_SUMMARY_CHARS
+
+    lines = [f"[worker] step {i}" for i in range(2000)]
+    prompt = build_cycle_prompt("Build X", Path("/work/x"), "\n".join(lines))
+
+    assert "[worker] step 1999" in prompt
+    assert "[worker] step 0\n" not in prompt
+    assert "earlier progress omitted" in prompt
+    assert len(prompt) < _PRIOR_SUMMARY_CHARS + 200
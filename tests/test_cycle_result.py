@@ -34,3 +34,15 @@ class TestRunResult:
         )
         assert rr.total_exchanges == 15
         assert rr.total_cost_usd == 1.5
+
+    def test_add_cycle_updates_totals(self) -> None:
+        rr = RunResult(cycles=[CycleResult(exchanges=3, total_cost_usd=0.25)])
+        rr.add_cycle(CycleResult(exchanges=4, total_cost_usd=0.5, finished=True))
+        assert len(rr.cycles) == 2
+        assert rr.total_exchanges == 7
+        assert rr.total_cost_usd == 0.75
+        assert rr.finished is True
+
+    def test_results_are_slotted(self) -> None:
+        assert not hasattr(CycleResult(), "__dict__")
+        assert not hasattr(RunResult(), "__dict__")
@@ -6,6 +6,7 @@ These tests focus on the MCP done handler wiring and DoneSignal state management
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import patch
 
@@ -23,6 +24,7 @@ def _make_done_handler(team, project_dir, goal="Build X"):
         patch("kodo.summarizer._probe_gemini", return_value=None),
     ):
         summarizer = Summarizer()
+        summarizer._backend_ready.wait(timeout=5)
     mcp = _build_mcp_server(team, project_dir, summarizer, signal, goal)
 
     # Extract the done handler from FastMCP's registered tools
@@ -45,7 +47,7 @@ class TestDoneHandlerAccepted:
             "architect": make_agent("ALL CHECKS PASS"),
         }
         done_fn, signal = _make_done_handler(team, tmp_project)
-        result = done_fn("Built everything", True)
+        result = asyncio.run(done_fn("Built everything", True))
 
         assert signal.called is True
         assert signal.success is True
@@ -59,7 +61,7 @@ class TestDoneHandlerAccepted:
             "architect": make_agent("ALL CHECKS PASS"),
         }
         done_fn, signal = _make_done_handler(team, tmp_project)
-        result = done_fn("Built everything", True)
+        result = asyncio.run(done_fn("Built everything", True))
 
         assert signal.called is False
         assert "REJECTED" in result
@@ -74,7 +76,7 @@ class TestDoneHandlerAccepted:
         done_fn, signal = _make_done_handler(team, tmp_project)
 
         with patch.object(tester, "run", wraps=tester.run) as mock_run:
-            result = done_fn("Gave up, blocked on API key", False)
+            result = asyncio.run(done_fn("Gave up, blocked on API key", False))
             mock_run.assert_not_called()
 
         assert signal.called is True
@@ -86,7 +88,7 @@ class TestDoneHandlerRejection:
     def test_rejection_tells_to_fix(self, tmp_project: Path) -> None:
         team = {"tester": make_agent("broken")}
         done_fn, signal = _make_done_handler(team, tmp_project)
-        result = done_fn("All done", True)
+        result = asyncio.run(done_fn("All done", True))
 
         assert "fix" in result.lower()
         assert "done again" in result.lower()
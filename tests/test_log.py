@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import sys
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 from kodo import log
 
@@ -27,3 +30,54 @@ def test_emit_writes_json_lines(tmp_path: Path):
     assert record["count"] == 42
     assert "ts" in record
     assert "t" in record
+
+
+def test_stats_table_written_in_one_print(tmp_path: Path):
+    log.init(tmp_path, run_id="stats_test")
+    log.get_run_stats().record_agent(
+        "worker", 0.5, 1000, 200, 3.0, False, "claude_subscription"
+    )
+    with patch("builtins.print") as mock_print:
+        log.print_stats_table()
+
+    assert mock_print.call_count == 1
+    table = mock_print.call_args.args[0]
+    assert "PROGRESS" in table
+    assert "worker" in table
+
+
+def test_stats_table_while_agents_record(tmp_path: Path):
+    """Printing the table must not race agents recording from other threads."""
+    log.init(tmp_path, run_id="stats_race")
+    stats = log.get_run_stats()
+    stats.record_agent("worker", 0.1, 10, 10, 1.0, False, "api")
+
+    def record_new_agents():
+        for i in range(100_000):
+            stats.record_agent(f"agent_{i}", 0.1, 10, 10, 1.0, False, "api")
+
+    # Switch threads often so the writer lands inside the table's loops
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    writer = threading.Thread(target=record_new_agents)
+    writer.start()
+    try:
+        with patch("builtins.print"):
+            while writer.is_alive():
+                log.print_stats_table()
+    finally:
+        writer.join()
+        sys.setswitchinterval(interval)
+    assert stats.total_exchanges == 100_001
+
+
+def test_run_stats_snapshot_is_detached():
+    stats = log.RunStats()
+    stats.record_agent("worker", 0.5, 100, 20, 1.0, False, "api")
+    snap = stats.snapshot()
+    stats.record_agent("worker", 0.5, 100, 20, 1.0, False, "api")
+    stats.record_agent("tester", 0.5, 100, 20, 1.0, False, "api")
+
+    assert list(snap.agents) == ["worker"]
+    assert snap.agents["worker"].calls == 1
+    assert snap.total_cost() == 0.5
@@ -13,6 +13,12 @@ from kodo.sessions.base import (
 from kodo.errors import AgentError, ErrorType
 
 
+@pytest.fixture
+def no_backoff_sleep(monkeypatch):
+    """Skip the real backoff sleeps in tests that only count attempts."""
+    monkeypatch.setattr("kodo.sessions.base.time.sleep", lambda s: None)
+
+
 class MockSessionWithRetry(SessionRetryMixin):
     """Mock session for testing retry logic."""
     
@@ -69,6 +75,7 @@ class TestSessionRetryMixin:
         assert "Response" in result.text
         assert session.query_call_count == 1  # Only called once
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_query_retries_once_then_succeeds(self):
         """Query that fails once then succeeds."""
         session = MockSessionWithRetry()
@@ -84,6 +91,7 @@ class TestSessionRetryMixin:
         assert result.is_error is False
         assert session.query_call_count == 2  # Failed once, succeeded on second
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_query_retries_multiple_times_then_succeeds(self):
         """Query that fails multiple times then succeeds."""
         session = MockSessionWithRetry()
@@ -99,6 +107,7 @@ class TestSessionRetryMixin:
         assert result.is_error is False
         assert session.query_call_count == 3  # Failed twice, succeeded on third
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_query_exceeds_max_retries(self):
         """Query that exceeds max retries returns error."""
         session = MockSessionWithRetry()
@@ -116,6 +125,7 @@ class TestSessionRetryMixin:
         assert result.error.error_type == ErrorType.TIMEOUT
         assert session.query_call_count == 3  # Initial + 2 retries
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_error_contains_context(self):
         """Error result contains rich context."""
         session = MockSessionWithRetry()
@@ -180,6 +190,7 @@ class TestSessionRetryMixin:
         # Should not retry auth failures — only called once
         assert call_count == 1
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_custom_max_retries(self):
         """Custom max_retries parameter is respected."""
         session = MockSessionWithRetry()
@@ -216,6 +227,7 @@ class TestSessionRetryMixin:
         # Should have slept: 0.02 + 0.03 = 0.05 seconds minimum
         assert elapsed >= 0.04
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_timeout_error_is_retriable(self):
         """Timeout errors trigger retries."""
         session = MockSessionWithRetry()
@@ -239,6 +251,7 @@ class TestSessionRetryMixin:
         assert result.is_error is False
         assert call_count == 2  # Called twice
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_network_error_is_retriable(self):
         """Network errors trigger retries."""
         session = MockSessionWithRetry()
@@ -262,6 +275,7 @@ class TestSessionRetryMixin:
         assert result.is_error is False
         assert call_count == 2
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_rate_limit_error_is_retriable(self):
         """Rate limit (429) errors trigger retries."""
         session = MockSessionWithRetry()
@@ -304,6 +318,7 @@ class TestSessionRetryEdgeCases:
         assert result.is_error is True
         assert session.query_call_count == 1  # No retries
     
+    @pytest.mark.usefixtures("no_backoff_sleep")
     def test_long_prompt_truncated_in_context(self):
         """Long prompts are truncated in error context."""
         session = MockSessionWithRetry()
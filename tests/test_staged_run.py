@@ -267,6 +267,33 @@ def test_staged_run_no_plan_uses_single_mode(mock_viewer, tmp_project):
     assert result.stage_results == []
 
 
+@patch("kodo.orchestrators.base.open_viewer", create=True)
+def test_run_closes_all_agents_even_if_one_fails(mock_viewer, tmp_project):
+    """A failing agent.close() is logged and does not skip the other agents."""
+    orch = FakeOrchestrator(cycle_results=[CycleResult(summary="done", finished=True)])
+    broken = make_agent()
+    broken.close = MagicMock(side_effect=RuntimeError("session already gone"))
+    healthy = make_agent()
+    healthy.close = MagicMock()
+    team = {"broken": broken, "healthy": healthy}
+
+    with patch("kodo.viewer.open_viewer", create=True):
+        result = orch.run("goal", tmp_project, team, max_cycles=1)
+
+    assert result.finished
+    broken.close.assert_called_once()
+    healthy.close.assert_called_once()
+    orch._summarizer.shutdown.assert_called_once()
+    events = [
+        json.loads(line)
+        for line in log.get_log_file().read_text().splitlines()
+    ]
+    close_errors = [e for e in events if e["event"] == "agent_close_error"]
+    assert len(close_errors) == 1
+    assert close_errors[0]["agent"] == "broken"
+    assert close_errors[0]["error"] == "session already gone"
+
+
 @patch("kodo.orchestrators.base.open_viewer", create=True)
 def test_staged_run_cycle_has_stage_index(mock_viewer, tmp_project):
     """Cycle results from staged runs should have stage_index set."""
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
-from kodo.summarizer import Summarizer
+import pytest
+
+from kodo.summarizer import Summarizer, _HTTPPool, _probe_ollama
 
 
 def _make_summarizer():
@@ -13,7 +19,9 @@ def _make_summarizer():
         patch("kodo.summarizer._probe_ollama", return_value=None),
         patch("kodo.summarizer._probe_gemini", return_value=None),
     ):
-        return Summarizer()
+        s = Summarizer()
+        s._backend_ready.wait(timeout=5)
+    return s
 
 
 def test_accumulated_summary_empty_initially() -> None:
@@ -34,8 +42,6 @@ def test_accumulated_summary_collects_truncation() -> None:
 
 def test_get_accumulated_summary_waits_for_pending(tmp_path) -> None:
     """BUG FIX: get_accumulated_summary must drain pending tasks first."""
-    import time
-
     s = _make_summarizer()
 
     # Patch _summarize_truncate to add a small delay
@@ -65,10 +71,10 @@ def test_clear_resets_summaries() -> None:
 
 
 def test_summarize_after_get_accumulated_summary() -> None:
-    """get_accumulated_summary restarts the executor so new work is accepted."""
+    """The worker keeps running after get_accumulated_summary drains it."""
     s = _make_summarizer()
     s.summarize("worker", "task1", "first result")
-    s.get_accumulated_summary()  # drains and restarts executor
+    s.get_accumulated_summary()  # drains the queue
 
     s.summarize("tester", "task2", "second result")
     acc = s.get_accumulated_summary()
@@ -79,3 +85,203 @@ def test_shutdown_is_idempotent() -> None:
     s = _make_summarizer()
     s.shutdown()
     s.shutdown()  # should not raise
+
+
+def test_shutdown_cancel_pending_drops_queued_jobs() -> None:
+    s = _make_summarizer()
+    started = threading.Event()
+    gate = threading.Event()
+    original = s._do_summarize
+
+    def blocked_summarize(agent_name, task, report):
+        started.set()
+        gate.wait(timeout=5)
+        original(agent_name, task, report)
+
+    s._do_summarize = blocked_summarize
+    s.summarize("worker", "task1", "first result")  # occupies the worker thread
+    assert started.wait(timeout=5)
+    s.summarize("tester", "task2", "second result")  # still queued
+    s.shutdown(wait=False, cancel_pending=True)
+    gate.set()
+    s._worker.join(timeout=5)
+
+    with s._lock:
+        summaries = list(s._summaries)
+    assert summaries == ["[worker] first result"]
+
+
+def _serve(handler_cls) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_http_pool_reuses_connection_per_host() -> None:
+    peers: list[tuple[str, int]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            peers.append(self.client_address)
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            reply = json.dumps({"echo": json.loads(body)}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(reply)))
+            self.end_headers()
+            self.wfile.write(reply)
+
+        def log_message(self, *args):
+            pass
+
+    server = _serve(Handler)
+    pool = _HTTPPool(timeout=5)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/api/generate"
+        replies = [pool.post_json(url, {"n": i}) for i in range(3)]
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    assert [r["echo"]["n"] for r in replies] == [0, 1, 2]
+    assert len(set(peers)) == 1  # all three requests rode one connection
+
+
+def test_http_pool_retries_when_server_drops_idle_connection() -> None:
+    peers: list[tuple[str, int]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            peers.append(self.client_address)
+            self.rfile.read(int(self.headers["Content-Length"]))
+            reply = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(reply)))
+            self.end_headers()
+            self.wfile.write(reply)
+            # Hang up without a "Connection: close" header, as an idle
+            # keep-alive timeout on the server would.
+            self.close_connection = True
+
+        def log_message(self, *args):
+            pass
+
+    server = _serve(Handler)
+    pool = _HTTPPool(timeout=5)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/api/generate"
+        replies = [pool.post_json(url, {"n": i}) for i in range(2)]
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    assert replies == [{"ok": True}, {"ok": True}]
+    assert len(set(peers)) == 2  # the second request went out on a fresh socket
+
+
+def test_http_pool_does_not_retry_timeouts() -> None:
+    hits: list[int] = []
+    release = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            hits.append(1)
+            self.rfile.read(int(self.headers["Content-Length"]))
+            if len(hits) > 1:
+                release.wait(timeout=5)  # outlasts the pool's timeout
+            reply = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(reply)))
+            self.end_headers()
+            self.wfile.write(reply)
+
+        def log_message(self, *args):
+            pass
+
+    server = _serve(Handler)
+    pool = _HTTPPool(timeout=0.2)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/api/generate"
+        pool.post_json(url, {})  # pools the connection
+        with pytest.raises(TimeoutError):
+            pool.post_json(url, {})
+    finally:
+        release.set()
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    assert len(hits) == 2  # the timed-out request was not re-sent
+
+
+def test_llm_summaries_cached_by_content() -> None:
+    s = _make_summarizer()
+    s._backend, s._backend_param = "ollama", "llama3"
+    with patch(
+        "kodo.summarizer._summarize_ollama",
+        side_effect=lambda http, model, task, report: f"Did: {task}",
+    ) as backend:
+        s.summarize("worker", "build X", "Created X.py")
+        s.summarize("tester", "build X", "Created X.py")  # identical input
+        s.summarize("worker", "build Y", "Created Y.py")
+        acc = s.get_accumulated_summary()
+
+    assert backend.call_count == 2
+    assert acc.splitlines() == [
+        "[worker] Did: build X",
+        "[tester] Did: build X",
+        "[worker] Did: build Y",
+    ]
+
+
+def test_worker_thread_persists_across_cycles() -> None:
+    s = _make_summarizer()
+    worker = s._worker
+    for i in range(3):
+        s.summarize("worker", f"task{i}", f"result {i}")
+        assert f"result {i}" in s.get_accumulated_summary()
+    assert s._worker is worker and worker.is_alive()
+
+    s.shutdown()
+    assert not worker.is_alive()
+    s.summarize("worker", "late", "ignored after shutdown")
+    assert "ignored" not in s.get_accumulated_summary()
+
+
+def test_backend_probed_off_the_constructing_thread() -> None:
+    release = threading.Event()
+
+    def slow_probe():
+        release.wait(timeout=5)
+        return "llama3"
+
+    with (
+        patch("kodo.summarizer._probe_ollama", side_effect=slow_probe),
+        patch("kodo.summarizer._probe_gemini", return_value=None),
+    ):
+        s = Summarizer()  # returns while the probe is still blocked
+        assert not s._backend_ready.is_set()
+        release.set()
+        assert s._backend_ready.wait(timeout=5)
+    assert (s._backend, s._backend_param) == ("ollama", "llama3")
+    s.shutdown()
+
+
+def test_probe_ollama_skips_http_when_port_closed() -> None:
+    with (
+        patch(
+            "kodo.summarizer.socket.create_connection",
+            side_effect=ConnectionRefusedError,
+        ),
+        patch("kodo.summarizer.urllib.request.urlopen") as urlopen,
+    ):
+        assert _probe_ollama() is None
+    urlopen.assert_not_called()
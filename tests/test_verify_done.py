@@ -126,6 +126,23 @@ def test_empty_team(tmp_project: Path) -> None:
     assert "verifier" in result.lower()
 
 
+@pytest.mark.parametrize(
+    "names,expected",
+    [
+        (["worker_fast", "worker", "worker_smart"], "worker_smart"),
+        (["worker_fast", "worker"], "worker"),
+        (["worker_fast", "designer"], "worker_fast"),
+    ],
+)
+def test_fallback_verifier_preference(tmp_project: Path, names, expected) -> None:
+    """Fallback picks worker_smart, then worker, then the first agent."""
+    team = {name: make_agent("Found a bug") for name in names}
+    result = verify_done(GOAL, SUMMARY, team, tmp_project)
+    assert result is not None
+    assert f"**{expected} (verifier) found issues:**" in result
+    assert result.count("(verifier) found issues") == 1
+
+
 def test_agents_called_with_new_conversation(tmp_project: Path) -> None:
     """Verification agents are called with new_conversation=True."""
     tester = make_agent("ALL CHECKS PASS")
@@ -224,6 +241,15 @@ def test_minor_issues_fixed_case_insensitive(tmp_project: Path) -> None:
     assert verify_done(GOAL, SUMMARY, team, tmp_project) is None
 
 
+def test_all_checks_pass_case_insensitive(tmp_project: Path) -> None:
+    """ALL CHECKS PASS matching is case-insensitive."""
+    team = {
+        "tester": make_agent("Everything ran fine — all checks pass."),
+        "architect": make_agent("All Checks Pass"),
+    }
+    assert verify_done(GOAL, SUMMARY, team, tmp_project) is None
+
+
 def test_second_attempt_keeps_session(tmp_project: Path) -> None:
     """Second done() call does not reset verifier sessions (reuses context)."""
     tester = make_agent("ALL CHECKS PASS")
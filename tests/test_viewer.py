@@ -0,0 +1,38 @@
+"""Tests for kodo.viewer log embedding."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from kodo.viewer import _embed_events
+
+
+def _embedded(log_path: Path) -> list[dict]:
+    embed = _embed_events(log_path).decode()
+    assert embed.startswith("EMBEDDED_DATA = ") and embed.endswith(";")
+    return json.loads(embed[len("EMBEDDED_DATA = ") : -1])
+
+
+def test_embeds_jsonl_lines_verbatim(tmp_path: Path) -> None:
+    events = [{"event": "run_start", "goal": "x"}, {"event": "run_end", "t": 1.5}]
+    log_path = tmp_path / "run.jsonl"
+    log_path.write_text("\n".join(json.dumps(e) for e in events) + "\n\n")
+
+    assert _embedded(log_path) == events
+
+
+def test_escapes_closing_script_tag(tmp_path: Path) -> None:
+    log_path = tmp_path / "run.jsonl"
+    log_path.write_text(json.dumps({"report": "<b>ok</b></script>"}) + "\n")
+
+    raw = _embed_events(log_path)
+    assert b"</script>" not in raw
+    assert _embedded(log_path) == [{"report": "<b>ok</b></script>"}]
+
+
+def test_truncated_line_is_dropped(tmp_path: Path) -> None:
+    log_path = tmp_path / "run.jsonl"
+    log_path.write_text('{"event": "run_start"}\n{"event": "agent_')
+
+    assert _embedded(log_path) == [{"event": "run_start"}]